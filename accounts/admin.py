@@ -8,6 +8,8 @@ display options, search fields, and filters for administrative use.
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
+from elearning.admin import ContentPreviewAdminMixin
+
 from .models import Profile, StatusUpdate, User
 
 
@@ -44,17 +46,16 @@ class ProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'department', 'student_id', 'phone']
     search_fields = ['user__username', 'user__email', 'department']
     list_filter = ['department']
+    list_select_related = ['user']
 
 
 @admin.register(StatusUpdate)
-class StatusUpdateAdmin(admin.ModelAdmin):
+class StatusUpdateAdmin(ContentPreviewAdminMixin, admin.ModelAdmin):
     """Admin for the StatusUpdate model."""
     list_display = ['user', 'content_preview', 'created_at']
     search_fields = ['user__username', 'content']
     list_filter = ['created_at']
     ordering = ['-created_at']
+    list_select_related = ['user']
 
-    def content_preview(self, obj):
-        """Return truncated content for the list display."""
-        return obj.content[:80] + '...' if len(obj.content) > 80 else obj.content
-    content_preview.short_description = 'Content'
+    preview_length = 80
@@ -10,6 +10,10 @@ from django.contrib.auth.forms import UserCreationForm
 
 from .models import Profile, StatusUpdate, User
 
+# Shared Bootstrap attrs for plain inputs. Widgets copy the attrs dict
+# they are given, so one module-level dict can back every widget.
+FORM_CONTROL_ATTRS = {'class': 'form-control'}
+
 
 class UserRegistrationForm(UserCreationForm):
     """
@@ -33,17 +37,23 @@ class UserRegistrationForm(UserCreationForm):
             'role', 'password1', 'password2',
         ]
         widgets = {
-            'username': forms.TextInput(attrs={'class': 'form-control'}),
-            'email': forms.EmailInput(attrs={'class': 'form-control'}),
-            'first_name': forms.TextInput(attrs={'class': 'form-control'}),
-            'last_name': forms.TextInput(attrs={'class': 'form-control'}),
+            'username': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'email': forms.EmailInput(attrs=FORM_CONTROL_ATTRS),
+            'first_name': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'last_name': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
         }
 
     def __init__(self, *args, **kwargs):
-        """Add Bootstrap CSS classes to password fields."""
+        """
+        Add Bootstrap CSS classes to password fields.
+
+        password1/password2 are declared on UserCreationForm itself, so
+        Meta.widgets does not apply to them and mutating the shared
+        class-level fields would leak into the admin's forms too.
+        """
         super().__init__(*args, **kwargs)
-        self.fields['password1'].widget.attrs['class'] = 'form-control'
-        self.fields['password2'].widget.attrs['class'] = 'form-control'
+        for name in ('password1', 'password2'):
+            self.fields[name].widget.attrs.update(FORM_CONTROL_ATTRS)
 
 
 class ProfileEditForm(forms.ModelForm):
@@ -66,15 +76,15 @@ class ProfileEditForm(forms.ModelForm):
                 'rows': 3,
                 'placeholder': 'Tell others about yourself...',
             }),
-            'avatar': forms.ClearableFileInput(attrs={'class': 'form-control'}),
+            'avatar': forms.ClearableFileInput(attrs=FORM_CONTROL_ATTRS),
             'date_of_birth': forms.DateInput(attrs={
                 'class': 'form-control',
                 'type': 'date',
             }),
-            'phone': forms.TextInput(attrs={'class': 'form-control'}),
-            'department': forms.TextInput(attrs={'class': 'form-control'}),
-            'student_id': forms.TextInput(attrs={'class': 'form-control'}),
-            'enrollment_year': forms.NumberInput(attrs={'class': 'form-control'}),
+            'phone': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'department': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'student_id': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'enrollment_year': forms.NumberInput(attrs=FORM_CONTROL_ATTRS),
         }
 
 
@@ -90,9 +100,9 @@ class UserEditForm(forms.ModelForm):
         model = User
         fields = ['first_name', 'last_name', 'email']
         widgets = {
-            'first_name': forms.TextInput(attrs={'class': 'form-control'}),
-            'last_name': forms.TextInput(attrs={'class': 'form-control'}),
-            'email': forms.EmailInput(attrs={'class': 'form-control'}),
+            'first_name': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'last_name': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
+            'email': forms.EmailInput(attrs=FORM_CONTROL_ATTRS),
         }
 
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_managers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='department',
+            field=models.CharField(blank=True, db_index=True, help_text='Academic department (teachers only).', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('student', 'Student'), ('teacher', 'Teacher')], db_index=True, default='student', help_text='Determines the user permissions level within the platform.', max_length=10),
+        ),
+    ]
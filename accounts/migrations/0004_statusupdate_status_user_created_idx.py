@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_profile_department_alter_user_role'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='statusupdate',
+            index=models.Index(fields=['user', '-created_at'], name='status_user_created_idx'),
+        ),
+    ]
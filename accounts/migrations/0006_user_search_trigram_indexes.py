@@ -0,0 +1,74 @@
+"""
+Trigram indexes backing the user search page (UserSearchView).
+
+The search ORs icontains lookups over four columns, which PostgreSQL
+compiles to UPPER("column"::text) LIKE UPPER('%term%'). A leading
+wildcard cannot use a btree index, so each column gets a pg_trgm GIN
+index on exactly that expression, and the OR becomes a bitmap index scan.
+
+pg_trgm is a trusted extension from PostgreSQL 13, so a role with CREATE
+on the database (e.g. its owner) can install it. On older servers, or for
+a role without that privilege, a superuser must run
+``CREATE EXTENSION pg_trgm;`` once before migrating; TrigramExtension
+sees the installed extension and does not try to create it again.
+
+PostgreSQL only: on other backends (SQLite in development) this
+migration is a no-op.
+"""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+from django.db.models.functions import Upper
+
+SEARCH_COLUMNS = ['username', 'first_name', 'last_name', 'email']
+
+
+class KeepTrigramExtension(TrigramExtension):
+    """
+    Install pg_trgm going forwards and leave it in place going backwards.
+
+    The extension may have been installed by a superuser or be used by
+    other objects, so unapplying the indexes does not drop it.
+    """
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+
+def trigram_indexes():
+    return [
+        GinIndex(
+            OpClass(Upper(column), name='gin_trgm_ops'),
+            name=f'user_{column}_trgm_idx',
+        )
+        for column in SEARCH_COLUMNS
+    ]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    User = apps.get_model('accounts', 'User')
+    for index in trigram_indexes():
+        schema_editor.add_index(User, index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    User = apps.get_model('accounts', 'User')
+    for index in trigram_indexes():
+        schema_editor.remove_index(User, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_alter_user_options'),
+    ]
+
+    operations = [
+        KeepTrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
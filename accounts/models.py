@@ -8,7 +8,45 @@ StatusUpdate model for user home page posts.
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import UserManager as BaseUserManager
+from django.core.cache import cache
+from django.db import models, transaction
+
+# Number of status updates shown on a profile page, and how long (in
+# seconds) that list stays cached between profile views
+RECENT_STATUS_LIMIT = 10
+RECENT_STATUS_CACHE_TIMEOUT = 300
+
+
+class UserManager(BaseUserManager):
+    """
+    Manager for the custom User model.
+
+    Adds a bulk creation path for imports and seeding. bulk_create()
+    bypasses the post_save signal that normally creates each profile,
+    so the matching profiles are inserted here in a second batch.
+    """
+
+    def bulk_create_with_profiles(self, users, profile_fields=None, batch_size=500):
+        """
+        Insert users and their profiles in two batched queries.
+
+        profile_fields, if given, is a list of dicts of Profile field
+        values, one per user in the same order; otherwise the profiles
+        are created empty.
+        """
+        if profile_fields is None:
+            profile_fields = [{}] * len(users)
+        with transaction.atomic(using=self.db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            Profile.objects.using(self.db).bulk_create(
+                [
+                    Profile(user=user, **fields)
+                    for user, fields in zip(users, profile_fields)
+                ],
+                batch_size=batch_size,
+            )
+        return users
 
 
 class User(AbstractUser):
@@ -27,6 +65,7 @@ class User(AbstractUser):
         max_length=10,
         choices=Role.choices,
         default=Role.STUDENT,
+        db_index=True,
         help_text='Determines the user permissions level within the platform.',
     )
     email = models.EmailField(
@@ -34,23 +73,31 @@ class User(AbstractUser):
         help_text='Required. Used for account identification and notifications.',
     )
 
+    objects = UserManager()
+
     class Meta:
-        ordering = ['username']
+        # No default ordering: listings that need one (admin, API, search)
+        # order explicitly, so lookups and joins skip a needless sort
         verbose_name = 'User'
         verbose_name_plural = 'Users'
 
     def __str__(self):
-        return f'{self.get_full_name()} ({self.role})'
+        # Built from the name fields directly rather than through
+        # get_full_name(); falls back to the username when no name is set
+        name = f'{self.first_name} {self.last_name}'.strip() or self.username
+        return f'{name} ({self.role})'
 
     @property
     def is_teacher(self):
         """Return True if this user has the teacher role."""
-        return self.role == self.Role.TEACHER
+        # Compared against the raw value: this is checked on nearly every
+        # request, and skips the lookup through the Role enum.
+        return self.role == 'teacher'
 
     @property
     def is_student(self):
         """Return True if this user has the student role."""
-        return self.role == self.Role.STUDENT
+        return self.role == 'student'
 
 
 class Profile(models.Model):
@@ -85,6 +132,7 @@ class Profile(models.Model):
     department = models.CharField(
         max_length=100,
         blank=True,
+        db_index=True,
         help_text='Academic department (teachers only).',
     )
 
@@ -133,8 +181,39 @@ class StatusUpdate(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Serves the per-user feed: user.status_updates newest first
+            models.Index(
+                fields=['user', '-created_at'],
+                name='status_user_created_idx',
+            ),
+        ]
         verbose_name = 'Status Update'
         verbose_name_plural = 'Status Updates'
 
     def __str__(self):
         return f'{self.user.username}: {self.content[:50]}'
+
+    @staticmethod
+    def recent_cache_key(user_id):
+        """Return the cache key holding a user's most recent status updates."""
+        return f'status_updates:recent:{user_id}'
+
+    @classmethod
+    def recent_for_user(cls, user_id):
+        """
+        Return the user's most recent status updates, newest first.
+
+        The list is cached between profile views and invalidated by the
+        post_save/post_delete signals whenever one of the user's status
+        updates changes.
+        """
+        key = cls.recent_cache_key(user_id)
+        status_updates = cache.get(key)
+        if status_updates is None:
+            status_updates = list(
+                cls.objects.filter(user_id=user_id)
+                .order_by('-created_at')[:RECENT_STATUS_LIMIT]
+            )
+            cache.set(key, status_updates, RECENT_STATUS_CACHE_TIMEOUT)
+        return status_updates
@@ -7,6 +7,7 @@ registration with password hashing.
 """
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
 from .models import Profile, StatusUpdate
@@ -43,6 +44,8 @@ class UserSerializer(serializers.ModelSerializer):
 
     Includes a nested read-only profile and computed full_name field.
     Does not expose password or other sensitive authentication fields.
+    Querysets serialized with many=True should select_related('profile')
+    so the nested profile does not cost one query per user.
     """
 
     profile = ProfileSerializer(read_only=True)
@@ -68,6 +71,23 @@ class UserSerializer(serializers.ModelSerializer):
         return obj.get_full_name() or obj.username
 
 
+class UserListSerializer(UserSerializer):
+    """
+    Slim serializer for user listings.
+
+    Omits the nested profile so list pages neither join the profile
+    table nor resolve an avatar URL per user. The full representation
+    is available from the detail endpoint.
+    """
+
+    profile = None
+
+    class Meta(UserSerializer.Meta):
+        fields = [
+            field for field in UserSerializer.Meta.fields if field != 'profile'
+        ]
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration via the API.
@@ -102,6 +122,9 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'password_confirm',
         ]
         read_only_fields = ['id']
+        # Email uniqueness is enforced by the database constraint (see
+        # create()) instead of a separate SELECT before every insert
+        extra_kwargs = {'email': {'validators': []}}
 
     def validate(self, attrs):
         """Ensure both password fields match."""
@@ -112,8 +135,21 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        """Create a new user with a properly hashed password."""
-        return User.objects.create_user(**validated_data)
+        """
+        Create a new user with a properly hashed password.
+
+        A duplicate email is reported as a validation error on the email
+        field when the unique constraint rejects the insert.
+        """
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(**validated_data)
+        except IntegrityError:
+            if User.objects.filter(email=validated_data.get('email')).exists():
+                raise serializers.ValidationError(
+                    {'email': 'A user with that email already exists.'}
+                )
+            raise
 
 
 class StatusUpdateSerializer(serializers.ModelSerializer):
@@ -121,11 +157,13 @@ class StatusUpdateSerializer(serializers.ModelSerializer):
     Serializer for user status updates.
 
     The user field is set automatically from the request context and
-    is displayed as a username string for readability.
+    is exposed as the owner's primary key, read straight off the foreign
+    key column; username is provided alongside it for display and is
+    read from the author_username annotation added by the viewset.
     """
 
-    user = serializers.StringRelatedField(read_only=True)
-    username = serializers.CharField(source='user.username', read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    username = serializers.CharField(source='author_username', read_only=True)
 
     class Meta:
         model = StatusUpdate
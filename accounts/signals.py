@@ -2,23 +2,33 @@
 Signals for the accounts application.
 
 Automatically creates a Profile instance when a new User is created,
-ensuring every user always has an associated profile for their home page.
+ensuring every user always has an associated profile for their home page,
+and keeps the cached list of recent status updates in step with the
+database.
 """
 
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Profile, User
+from .models import Profile, StatusUpdate, User
 
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
-    """Create a Profile for every newly created User."""
+    """
+    Create a Profile for every newly created User.
+
+    Only acts on creation: profile edits are saved through their own
+    forms and serializers, so re-saving the profile on every User.save()
+    (e.g. the last_login update on each login) would be wasted queries.
+    """
     if created:
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save the Profile whenever the User is saved."""
-    instance.profile.save()
+@receiver(post_save, sender=StatusUpdate)
+@receiver(post_delete, sender=StatusUpdate)
+def invalidate_recent_status_updates(sender, instance, **kwargs):
+    """Drop the owner's cached recent status list after any change."""
+    cache.delete(StatusUpdate.recent_cache_key(instance.user_id))
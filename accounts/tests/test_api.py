@@ -6,30 +6,38 @@ API ViewSets including authentication and permission checks.
 """
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
+from accounts.models import StatusUpdate
+
 User = get_user_model()
 
 
 class UserAPITest(APITestCase):
     """Tests for the User API endpoints."""
 
-    def setUp(self):
-        self.teacher = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(
             username='api_teacher',
             email='apiteacher@test.com',
             password='testpass123',
             role='teacher',
         )
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username='api_student',
             email='apistudent@test.com',
             password='testpass123',
             role='student',
         )
-        self.token = Token.objects.create(user=self.teacher)
+        cls.token = Token.objects.create(user=cls.teacher)
+
+    def setUp(self):
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
 
     def test_user_list(self):
@@ -37,6 +45,14 @@ class UserAPITest(APITestCase):
         response = self.client.get('/api/v1/accounts/users/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_user_list_renders_json(self):
+        """The orjson renderer should emit the serialized data as JSON."""
+        response = self.client.get('/api/v1/accounts/users/')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            response.json()['count'], response.data['count'],
+        )
+
     def test_user_list_filter_by_role(self):
         """User list can be filtered by role query parameter."""
         response = self.client.get('/api/v1/accounts/users/?role=teacher')
@@ -45,11 +61,31 @@ class UserAPITest(APITestCase):
         for user in response.data['results']:
             self.assertEqual(user['role'], 'teacher')
 
+    def test_user_list_query_count_independent_of_page_size(self):
+        """Nested profiles should be joined, not fetched once per user."""
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get('/api/v1/accounts/users/')
+        for i in range(5):
+            User.objects.create_user(
+                username=f'extra_{i}',
+                email=f'extra_{i}@test.com',
+                password='testpass123',
+            )
+        with CaptureQueriesContext(connection) as larger:
+            self.client.get('/api/v1/accounts/users/')
+        self.assertEqual(len(larger), len(baseline))
+
     def test_user_detail(self):
         """Authenticated user can view user details."""
         response = self.client.get(f'/api/v1/accounts/users/{self.student.pk}/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], 'api_student')
+        self.assertIn('profile', response.data)
+
+    def test_user_list_omits_profile(self):
+        """List entries use the slim representation without a profile."""
+        response = self.client.get('/api/v1/accounts/users/')
+        self.assertNotIn('profile', response.data['results'][0])
 
     def test_current_user_endpoint(self):
         """The /me/ endpoint should return the authenticated user."""
@@ -113,18 +149,22 @@ class RegistrationAPITest(APITestCase):
         }
         response = self.client.post('/api/v1/accounts/register/', data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
 
 
 class StatusUpdateAPITest(APITestCase):
     """Tests for the status update API endpoints."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='status_api_user',
             email='statusapi@test.com',
             password='testpass123',
         )
-        self.token = Token.objects.create(user=self.user)
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
 
     def test_create_status_update(self):
@@ -135,8 +175,42 @@ class StatusUpdateAPITest(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['content'], 'API status update!')
+        self.assertEqual(response.data['user'], self.user.pk)
+        self.assertEqual(response.data['username'], 'status_api_user')
 
     def test_list_status_updates(self):
         """Authenticated user can list status updates."""
         response = self.client.get('/api/v1/accounts/status-updates/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_status_updates_cursor_paginated(self):
+        """The status feed should page newest first using cursor links."""
+        for i in range(25):
+            StatusUpdate.objects.create(user=self.user, content=f'Update {i}')
+        response = self.client.get('/api/v1/accounts/status-updates/')
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertEqual(response.data['results'][0]['content'], 'Update 24')
+        self.assertEqual(
+            response.data['results'][0]['username'], 'status_api_user',
+        )
+        self.assertNotIn('count', response.data)
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_status_update_cursor_with_shared_timestamps(self):
+        """Rows sharing a created_at page through without gaps or repeats."""
+        for i in range(25):
+            StatusUpdate.objects.create(user=self.user, content=f'Update {i}')
+        StatusUpdate.objects.update(created_at=timezone.now())
+        for url in [
+            '/api/v1/accounts/status-updates/',
+            '/api/v1/accounts/status-updates/?ordering=created_at,id',
+        ]:
+            ids = []
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                ids += [row['id'] for row in response.data['results']]
+                url = response.data['next']
+            self.assertEqual(len(ids), 25)
+            self.assertEqual(len(set(ids)), 25)
@@ -17,9 +17,10 @@ User = get_user_model()
 class UserModelTest(TestCase):
     """Tests for the custom User model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test users for each role."""
-        self.teacher = User.objects.create_user(
+        cls.teacher = User.objects.create_user(
             username='teacher1',
             email='teacher1@test.com',
             password='testpass123',
@@ -27,7 +28,7 @@ class UserModelTest(TestCase):
             first_name='Test',
             last_name='Teacher',
         )
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username='student1',
             email='student1@test.com',
             password='testpass123',
@@ -69,17 +70,40 @@ class UserModelTest(TestCase):
         expected = 'Test Teacher (teacher)'
         self.assertEqual(str(self.teacher), expected)
 
+    def test_str_falls_back_to_username(self):
+        """Users without a name should be shown by username."""
+        user = User(username='nameless', role='student')
+        self.assertEqual(str(user), 'nameless (student)')
+
+    def test_bulk_create_with_profiles(self):
+        """Bulk-created users should each receive a profile."""
+        users = User.objects.bulk_create_with_profiles([
+            User(username=f'bulk_{i}', email=f'bulk_{i}@test.com')
+            for i in range(3)
+        ])
+        self.assertEqual(
+            Profile.objects.filter(user__in=users).count(), len(users),
+        )
+
+    def test_bulk_create_with_profile_fields(self):
+        """Profile values passed alongside the users should be saved."""
+        user, = User.objects.bulk_create_with_profiles(
+            [User(username='bulk_dept', email='bulk_dept@test.com')],
+            profile_fields=[{'department': 'Physics'}],
+        )
+        self.assertEqual(Profile.objects.get(user=user).department, 'Physics')
+
     def test_user_ordering(self):
-        """Users should be ordered by username."""
-        users = list(User.objects.values_list('username', flat=True))
-        self.assertEqual(users, sorted(users))
+        """User has no default ordering; listings order explicitly."""
+        self.assertFalse(User.objects.all().ordered)
 
 
 class ProfileModelTest(TestCase):
     """Tests for the Profile model and auto-creation signal."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='profile_test',
             email='profile@test.com',
             password='testpass123',
@@ -109,8 +133,9 @@ class ProfileModelTest(TestCase):
 class StatusUpdateModelTest(TestCase):
     """Tests for the StatusUpdate model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='status_user',
             email='status@test.com',
             password='testpass123',
@@ -6,7 +6,10 @@ and status update creation/deletion.
 """
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 User = get_user_model()
@@ -57,13 +60,16 @@ class RegistrationViewTest(TestCase):
 class LoginViewTest(TestCase):
     """Tests for the login view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='logintest',
             email='login@test.com',
             password='testpass123',
         )
+
+    def setUp(self):
+        self.client = Client()
         self.url = reverse('login')
 
     def test_login_page_loads(self):
@@ -91,15 +97,20 @@ class LoginViewTest(TestCase):
 class ProfileViewTest(TestCase):
     """Tests for profile detail and edit views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='profileuser',
             email='profile@test.com',
             password='testpass123',
             first_name='Profile',
             last_name='User',
         )
+
+    def setUp(self):
+        # Recent status lists are cached; start every test from a clean cache
+        cache.clear()
+        self.client = Client()
         self.client.login(username='profileuser', password='testpass123')
 
     def test_profile_detail_loads(self):
@@ -110,6 +121,14 @@ class ProfileViewTest(TestCase):
         # Template renders full name via get_full_name
         self.assertContains(response, 'Profile User')
 
+    def test_profile_shows_new_status_after_cached_view(self):
+        """Posting a status should invalidate the cached status list."""
+        url = reverse('profile-detail', kwargs={'pk': self.user.pk})
+        self.client.get(url)
+        self.client.post(reverse('status-create'), {'content': 'Fresh status'})
+        response = self.client.get(url)
+        self.assertContains(response, 'Fresh status')
+
     def test_profile_edit_loads(self):
         """Profile edit page should load for the profile owner."""
         url = reverse('profile-edit')
@@ -142,14 +161,14 @@ class ProfileViewTest(TestCase):
 class UserSearchViewTest(TestCase):
     """Tests for the user search functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='searcher',
             email='searcher@test.com',
             password='testpass123',
         )
-        self.teacher = User.objects.create_user(
+        cls.teacher = User.objects.create_user(
             username='searchable_teacher',
             email='searchteacher@test.com',
             password='testpass123',
@@ -157,6 +176,9 @@ class UserSearchViewTest(TestCase):
             first_name='Searchable',
             last_name='Teacher',
         )
+
+    def setUp(self):
+        self.client = Client()
         self.client.login(username='searcher', password='testpass123')
 
     def test_search_page_loads(self):
@@ -184,13 +206,16 @@ class UserSearchViewTest(TestCase):
 class StatusUpdateViewTest(TestCase):
     """Tests for status update creation and deletion."""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='statususer',
             email='statusview@test.com',
             password='testpass123',
         )
+
+    def setUp(self):
+        self.client = Client()
         self.client.login(username='statususer', password='testpass123')
 
     def test_create_status(self):
@@ -213,3 +238,32 @@ class StatusUpdateViewTest(TestCase):
         response = self.client.post(url)
         self.assertEqual(response.status_code, 302)
         self.assertFalse(StatusUpdate.objects.filter(pk=status.pk).exists())
+
+
+class StatusUpdateAdminTest(TestCase):
+    """Tests for the StatusUpdate admin changelist."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username='statusadmin',
+            email='statusadmin@test.com',
+            password='testpass123',
+        )
+
+    def setUp(self):
+        self.client = Client()
+        self.client.login(username='statusadmin', password='testpass123')
+
+    def test_changelist_queries_do_not_grow_per_row(self):
+        """Each row's preview and checkbox label come from the list query."""
+        from accounts.models import StatusUpdate
+        url = reverse('admin:accounts_statusupdate_changelist')
+        StatusUpdate.objects.create(user=self.admin, content='x' * 200)
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+        for i in range(4):
+            StatusUpdate.objects.create(user=self.admin, content=f'Status {i}')
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(url)
+        self.assertContains(response, 'x' * 80 + '...')
@@ -52,9 +52,10 @@ class ProfileDetailView(LoginRequiredMixin, View):
 
     def get(self, request, pk):
         """Display the user profile with status updates and courses."""
-        user = get_object_or_404(User, pk=pk)
-        status_updates = user.status_updates.all()[:10]
-        status_form = StatusUpdateForm() if request.user == user else None
+        user = get_object_or_404(User.objects.select_related('profile'), pk=pk)
+        status_updates = StatusUpdate.recent_for_user(user.pk)
+        is_owner = request.user.pk == user.pk
+        status_form = StatusUpdateForm() if is_owner else None
 
         # Get course data based on role
         if user.is_teacher:
@@ -68,6 +69,7 @@ class ProfileDetailView(LoginRequiredMixin, View):
 
         context = {
             'profile_user': user,
+            'is_owner': is_owner,
             'status_updates': status_updates,
             'status_form': status_form,
             'courses': courses,
@@ -118,7 +120,8 @@ class UserSearchView(LoginRequiredMixin, View):
 
     Requirement R1(c): Teachers should be able to search for students
     and other teachers. The search checks username, first name, last name,
-    and email fields.
+    and email fields. On PostgreSQL each of these icontains lookups is
+    served by a trigram index (accounts migration 0006).
     """
 
     def get(self, request):
@@ -133,7 +136,10 @@ class UserSearchView(LoginRequiredMixin, View):
                 | Q(first_name__icontains=query)
                 | Q(last_name__icontains=query)
                 | Q(email__icontains=query)
-            ).exclude(pk=request.user.pk)
+            ).exclude(pk=request.user.pk).only(
+                # Just the columns the results template renders
+                'id', 'username', 'first_name', 'last_name', 'email', 'role',
+            ).order_by('username')
 
             # Apply optional role filter
             if role_filter in ('student', 'teacher'):
@@ -158,9 +164,7 @@ def status_create(request):
     if request.method == 'POST':
         form = StatusUpdateForm(request.POST)
         if form.is_valid():
-            status = form.save(commit=False)
-            status.user = request.user
-            status.save()
+            StatusUpdate.objects.create(user=request.user, **form.cleaned_data)
             messages.success(request, 'Status update posted.')
     return redirect('profile-detail', pk=request.user.pk)
 
@@ -7,17 +7,23 @@ enforce role-based access where needed.
 """
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
 from rest_framework import filters, mixins, permissions, status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 
+from elearning.pagination import CreatedAtCursorPagination
 from elearning.permissions import IsOwnerOrReadOnly
+from elearning.renderers import ORJSONRenderer
 
 from .models import Profile, StatusUpdate
 from .serializers import (
     ProfileSerializer,
     StatusUpdateSerializer,
+    UserListSerializer,
     UserRegistrationSerializer,
     UserSerializer,
 )
@@ -31,15 +37,20 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
 
     Supports search by username, first name, last name, and email.
     Supports filtering by role via query parameter (?role=teacher).
+    The list omits nested profiles; retrieve a user for the full record.
     Only authenticated users can access this endpoint.
 
     list:   GET /api/v1/accounts/users/
     detail: GET /api/v1/accounts/users/{id}/
     """
 
-    queryset = User.objects.select_related('profile').all()
+    # Authentication columns are never serialized, so skip loading them
+    queryset = User.objects.defer(
+        'password', 'last_login', 'is_superuser', 'is_staff', 'is_active',
+    )
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['username', 'first_name', 'last_name', 'email']
     ordering_fields = ['username', 'date_joined']
@@ -52,11 +63,20 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         Query parameter: ?role=student or ?role=teacher
         """
         queryset = super().get_queryset()
+        if self.action != 'list':
+            # Only the full serializer nests the profile
+            queryset = queryset.select_related('profile')
         role = self.request.query_params.get('role')
         if role in ('student', 'teacher'):
             queryset = queryset.filter(role=role)
         return queryset
 
+    def get_serializer_class(self):
+        """Use the slim serializer (no nested profile) for listings."""
+        if self.action == 'list':
+            return UserListSerializer
+        return UserSerializer
+
     @action(detail=False, methods=['get'], url_path='me')
     def current_user(self, request):
         """
@@ -87,10 +107,12 @@ class RegistrationViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
 
-        # Create an API authentication token for the new user
-        token, _ = Token.objects.get_or_create(user=user)
+        # Commit the user, their profile and their token together
+        with transaction.atomic():
+            user = serializer.save()
+            # Create an API authentication token for the new user
+            token = Token.objects.create(user=user)
 
         return Response(
             {
@@ -128,7 +150,8 @@ class StatusUpdateViewSet(viewsets.ModelViewSet):
 
     Users can create status updates (assigned to themselves) and
     can only edit or delete their own updates. All authenticated
-    users can list and view status updates.
+    users can list and view status updates. The list is cursor-paginated
+    newest first; follow the ``next`` link to page through it.
 
     list:     GET    /api/v1/accounts/status-updates/
     create:   POST   /api/v1/accounts/status-updates/
@@ -139,8 +162,13 @@ class StatusUpdateViewSet(viewsets.ModelViewSet):
 
     serializer_class = StatusUpdateSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     filter_backends = [filters.OrderingFilter]
-    ordering = ['-created_at']
+    # Cursor pages read the position off model attributes, so only
+    # plain columns can be ordered on
+    ordering_fields = ['created_at', 'updated_at', 'id']
+    ordering = ['-created_at', '-id']
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         """
@@ -148,7 +176,11 @@ class StatusUpdateViewSet(viewsets.ModelViewSet):
 
         Query parameter: ?user_id=123
         """
-        queryset = StatusUpdate.objects.select_related('user').all()
+        # Read the author's username as a plain column rather than
+        # building a related User instance for every row
+        queryset = StatusUpdate.objects.annotate(
+            author_username=F('user__username'),
+        )
         user_id = self.request.query_params.get('user_id')
         if user_id:
             queryset = queryset.filter(user_id=user_id)
@@ -156,4 +188,7 @@ class StatusUpdateViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Assign the status update to the requesting user."""
-        serializer.save(user=self.request.user)
+        status_update = serializer.save(user=self.request.user)
+        # New instances do not come from get_queryset(), so supply the
+        # annotation the serializer reads the username from
+        status_update.author_username = self.request.user.username
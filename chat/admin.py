@@ -1,12 +1,14 @@
 """
 Django admin configuration for the chat application.
 
-Registers ChatRoom and Message models for administrative management.
+Registers ChatRoom, Message and ReadState models for administrative management.
 """
 
 from django.contrib import admin
 
-from .models import ChatRoom, Message
+from elearning.admin import ContentPreviewAdminMixin
+
+from .models import ChatRoom, Message, ReadState
 
 
 @admin.register(ChatRoom)
@@ -15,18 +17,23 @@ class ChatRoomAdmin(admin.ModelAdmin):
     list_display = ['name', 'room_type', 'course', 'created_at']
     list_filter = ['room_type', 'created_at']
     search_fields = ['name', 'course__title', 'course__code']
-    filter_horizontal = ['participants']
+    # Searchable picker instead of rendering every user into the page
+    autocomplete_fields = ['participants']
 
 
 @admin.register(Message)
-class MessageAdmin(admin.ModelAdmin):
+class MessageAdmin(ContentPreviewAdminMixin, admin.ModelAdmin):
     """Admin for the Message model."""
-    list_display = ['sender', 'room', 'content_preview', 'timestamp', 'is_read']
-    list_filter = ['is_read', 'timestamp']
+    list_display = ['sender', 'room', 'content_preview', 'timestamp']
+    list_filter = ['timestamp']
     search_fields = ['sender__username', 'content']
-    ordering = ['-timestamp']
+    ordering = ['-timestamp', '-id']
+    list_select_related = ['sender', 'room__course']
+
 
-    def content_preview(self, obj):
-        """Return truncated message content for the list display."""
-        return obj.content[:60] + '...' if len(obj.content) > 60 else obj.content
-    content_preview.short_description = 'Content'
+@admin.register(ReadState)
+class ReadStateAdmin(admin.ModelAdmin):
+    """Admin for the ReadState model."""
+    list_display = ['user', 'room', 'last_read_message_id', 'updated_at']
+    list_select_related = ['user', 'room__course']
+    search_fields = ['user__username', 'room__name']
@@ -10,13 +10,32 @@ Both consumers use Redis as the channel layer backend and persist messages
 to the database for history retrieval.
 """
 
+import orjson
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.db.models import Exists, OuterRef, Q
 
 from .models import ChatRoom, Message
 
 
-class DirectChatConsumer(AsyncJsonWebsocketConsumer):
+class OrjsonMixin:
+    """
+    Encode and decode WebSocket JSON frames with orjson.
+
+    Replaces the stdlib json calls made by AsyncJsonWebsocketConsumer;
+    every frame sent to or received from a chat client goes through here.
+    """
+
+    @classmethod
+    async def decode_json(cls, text_data):
+        return orjson.loads(text_data)
+
+    @classmethod
+    async def encode_json(cls, content):
+        return orjson.dumps(content).decode()
+
+
+class DirectChatConsumer(OrjsonMixin, AsyncJsonWebsocketConsumer):
     """
     WebSocket consumer for 1-on-1 direct message conversations.
 
@@ -46,6 +65,13 @@ class DirectChatConsumer(AsyncJsonWebsocketConsumer):
             self.room_group_name,
             self.channel_name,
         )
+        # Broadcast fields that stay the same for every message sent
+        # over this connection
+        self.broadcast_fields = {
+            'type': 'chat.message',
+            'sender_id': self.user.id,
+            'sender_username': self.user.username,
+        }
         await self.accept()
 
     async def disconnect(self, close_code):
@@ -73,11 +99,10 @@ class DirectChatConsumer(AsyncJsonWebsocketConsumer):
         await self.channel_layer.group_send(
             self.room_group_name,
             {
-                'type': 'chat.message',
+                **self.broadcast_fields,
                 'message': message_text,
-                'sender_id': self.user.id,
-                'sender_username': self.user.username,
-                'timestamp': message.timestamp.isoformat(),
+                # Epoch milliseconds; the client formats it for display
+                'timestamp': int(message.timestamp.timestamp() * 1000),
             },
         )
 
@@ -92,10 +117,15 @@ class DirectChatConsumer(AsyncJsonWebsocketConsumer):
 
     @database_sync_to_async
     def is_participant(self):
-        """Check if the current user is a participant of this chat room."""
-        return ChatRoom.objects.filter(
-            id=self.room_id,
-            participants=self.user,
+        """
+        Check if the current user is a participant of this chat room.
+
+        Queries the M2M through table directly; its unique
+        (chatroom_id, user_id) index answers this without a join.
+        """
+        return ChatRoom.participants.through.objects.filter(
+            chatroom_id=self.room_id,
+            user_id=self.user.id,
         ).exists()
 
     @database_sync_to_async
@@ -108,7 +138,7 @@ class DirectChatConsumer(AsyncJsonWebsocketConsumer):
         )
 
 
-class GroupChatConsumer(AsyncJsonWebsocketConsumer):
+class GroupChatConsumer(OrjsonMixin, AsyncJsonWebsocketConsumer):
     """
     WebSocket consumer for course group chat rooms.
 
@@ -129,15 +159,26 @@ class GroupChatConsumer(AsyncJsonWebsocketConsumer):
             return
 
         # Verify the user is the course teacher or an enrolled student
-        if not await self.has_course_access():
+        course_code = await self.get_accessible_course_code()
+        if course_code is None:
             await self.close()
             return
 
+        # Resolve the chat room once so each message can be saved directly
+        self.room_id = await self.get_room_id(course_code)
+
         # Join the channel layer group for this course chat
         await self.channel_layer.group_add(
             self.room_group_name,
             self.channel_name,
         )
+        # Broadcast fields that stay the same for every message sent
+        # over this connection
+        self.broadcast_fields = {
+            'type': 'chat.message',
+            'sender_id': self.user.id,
+            'sender_username': self.user.username,
+        }
         await self.accept()
 
     async def disconnect(self, close_code):
@@ -165,11 +206,10 @@ class GroupChatConsumer(AsyncJsonWebsocketConsumer):
         await self.channel_layer.group_send(
             self.room_group_name,
             {
-                'type': 'chat.message',
+                **self.broadcast_fields,
                 'message': message_text,
-                'sender_id': self.user.id,
-                'sender_username': self.user.username,
-                'timestamp': message.timestamp.isoformat(),
+                # Epoch milliseconds; the client formats it for display
+                'timestamp': int(message.timestamp.timestamp() * 1000),
             },
         )
 
@@ -183,42 +223,45 @@ class GroupChatConsumer(AsyncJsonWebsocketConsumer):
         })
 
     @database_sync_to_async
-    def has_course_access(self):
+    def get_accessible_course_code(self):
         """
-        Check if the current user is the course teacher or an enrolled student.
+        Return the course code if the user is its teacher or an enrolled student.
 
-        Returns True if the user is authorized to participate in this
-        course's group chat, False otherwise.
+        Returns None when the user is not authorized to participate in
+        this course's group chat. The code is read by the same query so a
+        newly created room needs no extra course lookup.
         """
         from courses.models import Course, Enrollment
 
-        try:
-            course = Course.objects.get(id=self.course_id)
-        except Course.DoesNotExist:
-            return False
-
-        # Course teacher always has acces s
-        if course.teacher == self.user:
-            return True
-
-        #Check for active student enrollment
-        return Enrollment.objects.filter(
+        # Teacher ownership and active enrollment checked in one query
+        active_enrollment = Enrollment.objects.filter(
+            course=OuterRef('pk'),
             student=self.user,
-            course=course,
             status=Enrollment.Status.ACTIVE,
-        ).exists()
+        )
+        return Course.objects.filter(
+            Q(teacher=self.user) | Exists(active_enrollment),
+            id=self.course_id,
+        ).values_list('code', flat=True).first()
 
     @database_sync_to_async
-    def save_message(self, content):
-        """Persist a new message to the database and return it."""
-        # Get o r create the chat room for this couirse
+    def get_room_id(self, course_code):
+        """Return the ID of this course's chat room, creating it if missing."""
         room, _ = ChatRoom.objects.get_or_create(
             course_id=self.course_id,
             room_type=ChatRoom.RoomType.COURSE,
-            defaults={'name': f'Course {self.course_id} Chat'},
+            defaults={
+                'name': f'Course {self.course_id} Chat',
+                'course_code': course_code,
+            },
         )
+        return room.id
+
+    @database_sync_to_async
+    def save_message(self, content):
+        """Persist a new message to the database and return it."""
         return Message.objects.create(
-            room=room,
+            room_id=self.room_id,
             sender=self.user,
             content=content,
         )
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:07
+
+from django.db import migrations, models
+
+
+def backfill_dm_keys(apps, schema_editor):
+    """Key existing two-person DM rooms; the oldest room wins for duplicate pairs."""
+    ChatRoom = apps.get_model('chat', 'ChatRoom')
+    Participant = ChatRoom.participants.through
+    members = {}
+    for room_id, user_id in Participant.objects.filter(
+        chatroom__room_type='direct',
+    ).values_list('chatroom_id', 'user_id'):
+        members.setdefault(room_id, []).append(user_id)
+
+    seen = set()
+    for room_id in sorted(members):
+        user_ids = members[room_id]
+        if len(user_ids) != 2:
+            continue
+        low, high = sorted(user_ids)
+        key = f'{low}:{high}'
+        if key in seen:
+            continue
+        seen.add(key)
+        ChatRoom.objects.filter(pk=room_id).update(dm_key=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='dm_key',
+            field=models.CharField(blank=True, help_text='Canonical "<low id>:<high id>" pair for DMs (null for course chats).', max_length=40, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_dm_keys, migrations.RunPython.noop),
+    ]
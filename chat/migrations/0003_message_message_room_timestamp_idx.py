@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_chatroom_dm_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['room', '-timestamp'], name='message_room_timestamp_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0004_remove_message_is_read_readstate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='message',
+            options={'ordering': ['timestamp', 'id'], 'verbose_name': 'Message', 'verbose_name_plural': 'Messages'},
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_room_timestamp_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['room', '-timestamp', '-id'], name='message_room_timestamp_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:13
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_course_codes(apps, schema_editor):
+    ChatRoom = apps.get_model('chat', 'ChatRoom')
+    Course = apps.get_model('courses', 'Course')
+    ChatRoom.objects.filter(course__isnull=False).update(
+        course_code=Subquery(
+            Course.objects.filter(pk=OuterRef('course_id')).values('code')[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0005_alter_message_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='course_code',
+            field=models.CharField(blank=True, help_text='Copy of course.code so room lists need no join (null for DMs).', max_length=20, null=True),
+        ),
+        migrations.RunPython(copy_course_codes, migrations.RunPython.noop),
+    ]
@@ -7,8 +7,12 @@ Requirement R1(g): Users should be able to chat in real time.
 """
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 
+# Seconds a user's chat room list page stays cached
+ROOM_LIST_CACHE_TIMEOUT = 30
+
 
 class ChatRoom(models.Model):
     """
@@ -40,11 +44,24 @@ class ChatRoom(models.Model):
         related_name='chat_room',
         help_text='The course this group chat belongs to (null for DMs).',
     )
+    course_code = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        help_text='Copy of course.code so room lists need no join (null for DMs).',
+    )
     participants = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         related_name='chat_rooms',
         help_text='Users who are members of this chat room.',
     )
+    dm_key = models.CharField(
+        max_length=40,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text='Canonical "<low id>:<high id>" pair for DMs (null for course chats).',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -52,18 +69,57 @@ class ChatRoom(models.Model):
         verbose_name = 'Chat Room'
         verbose_name_plural = 'Chat Rooms'
 
+    def save(self, *args, **kwargs):
+        # Course codes are copied onto the room when it is first linked;
+        # later renames are synced by the Course post_save signal
+        if self.course_id and not self.course_code:
+            self.course_code = self.course.code
+        super().save(*args, **kwargs)
+
     def __str__(self):
         if self.room_type == self.RoomType.COURSE and self.course:
             return f'Course Chat: {self.course.code}'
         return f'DM: {self.name}'
 
+    @staticmethod
+    def direct_key(user_id, other_user_id):
+        """Return the order-independent dm_key for a pair of users."""
+        low, high = sorted((user_id, other_user_id))
+        return f'{low}:{high}'
+
+    @staticmethod
+    def room_list_cache_key(user_id):
+        """Return the cache key holding a user's chat room list."""
+        return f'chatrooms:{user_id}:v1'
+
+    @classmethod
+    def invalidate_room_lists(cls, user_ids):
+        """Drop the cached chat room lists of the given users."""
+        cache.delete_many([cls.room_list_cache_key(pk) for pk in user_ids])
+
+    def add_participants(self, *users):
+        """
+        Add users to the room in a single INSERT.
+
+        Unlike participants.add(), this skips the SELECT for existing
+        members and lets the (chatroom, user) unique constraint drop
+        duplicates. m2m_changed is not sent, so the users' cached room
+        lists are invalidated here instead.
+        """
+        through = ChatRoom.participants.through
+        through.objects.bulk_create(
+            [through(chatroom_id=self.pk, user_id=user.pk) for user in users],
+            ignore_conflicts=True,
+        )
+        self.invalidate_room_lists(user.pk for user in users)
+
 
 class Message(models.Model):
     """
     A single chat message within a chat room.
 
     Stores the message content, sender, and timestamp. Messages are
-    ordered chronologically and track read status for notification purposes.
+    ordered chronologically; read status is tracked per user by ReadState.
     """
 
     room = models.ForeignKey(
@@ -81,12 +137,55 @@ class Message(models.Model):
         help_text='Message text content.',
     )
     timestamp = models.DateTimeField(auto_now_add=True)
-    is_read = models.BooleanField(default=False)
 
     class Meta:
-        ordering = ['timestamp']
+        # id breaks ties between messages saved within the same instant
+        ordering = ['timestamp', 'id']
         verbose_name = 'Message'
         verbose_name_plural = 'Messages'
+        indexes = [
+            # Serves per-room history slices and the newest-message lookup
+            models.Index(
+                fields=['room', '-timestamp', '-id'],
+                name='message_room_timestamp_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.sender.username} @ {self.timestamp:%H:%M}: {self.content[:40]}'
+
+
+class ReadState(models.Model):
+    """
+    How far a user has read in a chat room.
+
+    A single pointer to the newest message the user has seen replaces a
+    read flag on every message: marking a room read is one row write, and
+    anything with a higher id from another sender is unread. Works the
+    same for DMs and multi-participant course chats.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='chat_read_states',
+    )
+    room = models.ForeignKey(
+        ChatRoom,
+        on_delete=models.CASCADE,
+        related_name='read_states',
+    )
+    last_read_message_id = models.PositiveBigIntegerField(
+        default=0,
+        help_text='Id of the newest message the user has read (0 for none).',
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # One read pointer per user per room
+        unique_together = ['user', 'room']
+        verbose_name = 'Read State'
+        verbose_name_plural = 'Read States'
+
+    def __str__(self):
+        return f'{self.user.username} read {self.room_id} up to {self.last_read_message_id}'
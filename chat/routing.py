@@ -5,17 +5,17 @@ Maps WebSocket connection paths to their corresponding consumer classes.
 Direct messages and course group chats each have their own consumer.
 """
 
-from django.urls import re_path
+from django.urls import path
 
 from . import consumers
 
 websocket_urlpatterns = [
-    re_path(
-        r'ws/chat/dm/(?P<room_id>\d+)/$',
+    path(
+        'ws/chat/dm/<int:room_id>/',
         consumers.DirectChatConsumer.as_asgi()
     ),
-    re_path(
-        r'ws/chat/course/(?P<course_id>\d+)/$',
+    path(
+        'ws/chat/course/<int:course_id>/',
         consumers.GroupChatConsumer.as_asgi()
     ),
 ]
@@ -6,12 +6,22 @@ nested participant l ists and sender information for API consumers.
 """
 
 from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.functions import Substr
 from rest_framework import serializers
 
 from .models import ChatRoom, Message
 
 User = get_user_model()
 
+# Characters of content shown in a room's last-message summary
+LAST_MESSAGE_PREVIEW_LENGTH = 100
+
+# Columns MessageSerializer reads; pass to .only() with select_related('sender')
+MESSAGE_ONLY_FIELDS = (
+    'room', 'sender__username', 'content', 'timestamp',
+)
+
 
 class MessageSerializer(serializers.ModelSerializer) :
     """
@@ -35,26 +45,48 @@ class MessageSerializer(serializers.ModelSerializer) :
             'sender_username',
             'content',
             'timestamp',
-            'is_read',
         ]
         read_only_fields = ['id', 'room', 'sender', 'timestamp']
 
 
+# Formats timestamps the way MessageSerializer's DateTimeField does
+_timestamp_field = serializers.DateTimeField()
+
+
+def message_values(queryset):
+    """
+    Return the message queryset as .values() rows shaped like MessageSerializer.
+
+    No Message or User instances are built. Pass the rows (or a page of
+    them) through format_message_rows() before rendering.
+    """
+    return queryset.values(
+        'id', 'room', 'sender', 'content', 'timestamp',
+        sender_username=F('sender__username'),
+    )
+
+
+def format_message_rows(rows):
+    """Format the timestamps of message_values() rows, as MessageSerializer would."""
+    rows = list(rows)
+    for row in rows:
+        row['timestamp'] = _timestamp_field.to_representation(row['timestamp'])
+    return rows
+
+
 class ChatRoomListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for chat room list endpoints.
 
     Shows room metadata and the number of participants without
-    including the full participant list or message history.
+    including the full participant list or message history. Expects
+    rooms annotated with participant_count and unread_count (see
+    ChatRoomViewSet).
     """
 
-    participant_count = serializers.SerializerMethodField()
+    participant_count = serializers.IntegerField(read_only=True)
+    unread_count = serializers.IntegerField(read_only=True)
     last_message = serializers.SerializerMethodField()
-    course_code = serializers.CharField(
-        source='course.code',
-        read_only=True,
-        default=None,
-    )
 
     class Meta:
         model = ChatRoom
@@ -65,22 +97,32 @@ class ChatRoomListSerializer(serializers.ModelSerializer):
             'course',
             'course_code',
             'participant_count',
+            'unread_count',
             'last_message',
             'created_at',
         ]
-        read_only_fields = ['id', 'created_at']
-
-    def get_participant_count(self, obj):
-        """Return the number of participants in this room."""
-        return obj.participants.count()
+        read_only_fields = ['id', 'course_code', 'created_at']
 
     def get_last_message(self, obj):
-        """Return a summary of the most recent message, or None."""
-        msg = obj.messages.order_by('-timestamp').first()
+        """
+        Return a summary of the most recent message, or None.
+
+        Uses the latest_messages prefetch from ChatRoomViewSet when
+        present, and falls back to a query for standalone rooms. Either
+        way only a content_preview is loaded, never the full content.
+        """
+        if hasattr(obj, 'latest_messages'):
+            msg = obj.latest_messages[0] if obj.latest_messages else None
+        else:
+            msg = obj.messages.annotate(
+                content_preview=Substr('content', 1, LAST_MESSAGE_PREVIEW_LENGTH),
+            ).select_related('sender').only(
+                'room', 'sender__username', 'timestamp',
+            ).order_by('-timestamp', '-id').first()
         if msg:
             return {
                 'sender': msg.sender.username,
-                'content': msg.content[:100],
+                'content': msg.content_preview,
                 'timestamp': msg.timestamp.isoformat(),
             }
         return None
@@ -100,11 +142,6 @@ class ChatRoomDetailSerializer(serializers.ModelSerializer):
         slug_field='username',
     )
     messages = serializers.SerializerMethodField()
-    course_code = serializers.CharField(
-        source='course.code',
-        read_only=True,
-        default=None,
-    )
 
     class Meta:
         model = ChatRoom
@@ -118,13 +155,17 @@ class ChatRoomDetailSerializer(serializers.ModelSerializer):
             'messages',
             'created_at',
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'course_code', 'created_at']
 
     def get_messages(self, obj):
         """Return the 50 most recent messages in chronological order."""
-        recent = obj.messages.select_related('sender').order_by('-timestamp')[:50]
-        # Reverse so oldest first
-        return MessageSerializer(reversed(list(recent)), many=True).data
+        # Pick the newest 50 in a subquery and let the database return
+        # them oldest first, rather than reversing a list in Python
+        newest = obj.messages.order_by('-timestamp', '-id').values('id')[:50]
+        recent = Message.objects.filter(
+            id__in=newest,
+        ).select_related('sender').only(*MESSAGE_ONLY_FIELDS).order_by('timestamp', 'id')
+        return MessageSerializer(recent, many=True).data
 
 
 class SendMessageSerializer(serializers.Serializer):
@@ -0,0 +1,45 @@
+"""
+Signals for the chat application.
+
+Keeps the per-user cached chat room lists (see ChatRoomListView) in
+step with the database when a course chat room appears or a student's
+enrollment changes. Direct message membership is invalidated by
+ChatRoom.add_participants(). Also keeps ChatRoom.course_code in step
+with its course.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from courses.models import Course, Enrollment
+
+from .models import ChatRoom
+
+
+@receiver(post_save, sender=ChatRoom)
+def invalidate_room_lists_on_course_room(sender, instance, created, **kwargs):
+    """Show a new course chat room to the teacher and enrolled students."""
+    if created and instance.course_id:
+        student_ids = Enrollment.objects.filter(
+            course_id=instance.course_id,
+            status=Enrollment.Status.ACTIVE,
+        ).values_list('student_id', flat=True)
+        ChatRoom.invalidate_room_lists(
+            [instance.course.teacher_id, *student_ids],
+        )
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_room_lists_on_enrollment(sender, instance, **kwargs):
+    """A student's course chats follow their active enrollments."""
+    ChatRoom.invalidate_room_lists([instance.student_id])
+
+
+@receiver(post_save, sender=Course)
+def sync_room_course_code(sender, instance, created, **kwargs):
+    """Carry a renamed course code over to its chat room."""
+    if not created:
+        ChatRoom.objects.filter(course=instance).exclude(
+            course_code=instance.code,
+        ).update(course_code=instance.code)
@@ -0,0 +1,181 @@
+"""
+Unit tests for chat application REST API endpoints.
+
+Tests the chat room list and detail endpoints, including the
+per-room summaries and the number of queries they cost.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from chat.models import ChatRoom, Message, ReadState
+from chat.serializers import MessageSerializer
+
+User = get_user_model()
+
+
+class ChatRoomAPITest(APITestCase):
+    """Tests for the chat room API endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='chat_api_user',
+            email='chatapi@test.com',
+            password='testpass123',
+        )
+        cls.other = User.objects.create_user(
+            username='chat_api_other',
+            email='chatapiother@test.com',
+            password='testpass123',
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.room = cls.create_dm_room('first')
+
+    @classmethod
+    def create_dm_room(cls, name):
+        room = ChatRoom.objects.create(
+            name=name,
+            room_type=ChatRoom.RoomType.DIRECT,
+        )
+        room.participants.add(cls.user, cls.other)
+        return room
+
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_room_list_last_message(self):
+        """Each listed room should summarise its newest message."""
+        Message.objects.create(room=self.room, sender=self.other, content='Old')
+        Message.objects.create(room=self.room, sender=self.user, content='New')
+        response = self.client.get('/api/v1/chat/rooms/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        room = response.data['results'][0]
+        self.assertEqual(room['last_message']['content'], 'New')
+        self.assertEqual(room['last_message']['sender'], 'chat_api_user')
+
+    def test_room_list_participant_count(self):
+        """The participant count should include every member of the room."""
+        response = self.client.get('/api/v1/chat/rooms/')
+        self.assertEqual(response.data['results'][0]['participant_count'], 2)
+
+    def test_room_list_without_messages(self):
+        """Rooms with no messages should report no last message."""
+        response = self.client.get('/api/v1/chat/rooms/')
+        self.assertIsNone(response.data['results'][0]['last_message'])
+
+    def test_room_list_query_count_independent_of_rooms(self):
+        """Listing more rooms should not cost more queries."""
+        Message.objects.create(room=self.room, sender=self.user, content='Hi')
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get('/api/v1/chat/rooms/')
+        for i in range(3):
+            room = self.create_dm_room(f'extra {i}')
+            Message.objects.create(room=room, sender=self.other, content='Hi')
+        with CaptureQueriesContext(connection) as larger:
+            response = self.client.get('/api/v1/chat/rooms/')
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertEqual(len(larger), len(baseline))
+
+    def test_room_detail_recent_messages_oldest_first(self):
+        """Room detail should list the newest 50 messages, oldest first."""
+        Message.objects.bulk_create([
+            Message(room=self.room, sender=self.user, content=f'Message {i}')
+            for i in range(55)
+        ])
+        response = self.client.get(f'/api/v1/chat/rooms/{self.room.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        contents = [m['content'] for m in response.data['messages']]
+        self.assertEqual(contents, [f'Message {i}' for i in range(5, 55)])
+
+    def test_room_detail_participants(self):
+        """Room detail should list every participant by username."""
+        response = self.client.get(f'/api/v1/chat/rooms/{self.room.pk}/')
+        self.assertCountEqual(
+            response.data['participants'],
+            ['chat_api_user', 'chat_api_other'],
+        )
+
+    def test_send_message(self):
+        """Participants can post a message to a room."""
+        response = self.client.post(
+            f'/api/v1/chat/rooms/{self.room.pk}/send/',
+            {'content': 'Hello via API'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(
+            self.room.messages.filter(content='Hello via API').exists()
+        )
+
+    def test_send_message_non_participant(self):
+        """Users outside the room cannot post to it."""
+        outsider_room = ChatRoom.objects.create(
+            name='private', room_type=ChatRoom.RoomType.DIRECT,
+        )
+        outsider_room.participants.add(self.other)
+        response = self.client.post(
+            f'/api/v1/chat/rooms/{outsider_room.pk}/send/',
+            {'content': 'Intrusion'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(outsider_room.messages.exists())
+
+    def test_mark_read(self):
+        """Marking read should move the user's pointer to the newest message."""
+        Message.objects.create(room=self.room, sender=self.other, content='Theirs')
+        newest = Message.objects.create(room=self.room, sender=self.user, content='Mine')
+        response = self.client.post(f'/api/v1/chat/rooms/{self.room.pk}/mark-read/')
+        self.assertEqual(response.data, {'last_read_message_id': newest.pk})
+        state = ReadState.objects.get(user=self.user, room=self.room)
+        self.assertEqual(state.last_read_message_id, newest.pk)
+
+    def test_mark_read_never_moves_pointer_back(self):
+        """A request that saw an older newest message must not rewind the pointer."""
+        Message.objects.create(room=self.room, sender=self.other, content='Old')
+        newest = Message.objects.create(room=self.room, sender=self.other, content='New')
+        newest_id = newest.pk
+        self.client.post(f'/api/v1/chat/rooms/{self.room.pk}/mark-read/')
+        # Removing the newest message makes the next call read an older
+        # Max(id), like an overlapping request that started before it
+        newest.delete()
+        self.client.post(f'/api/v1/chat/rooms/{self.room.pk}/mark-read/')
+        state = ReadState.objects.get(user=self.user, room=self.room)
+        self.assertEqual(state.last_read_message_id, newest_id)
+
+    def test_mark_read_non_participant(self):
+        """Users outside the room get a 404 and no read pointer."""
+        outsider_room = ChatRoom.objects.create(
+            name='private', room_type=ChatRoom.RoomType.DIRECT,
+        )
+        outsider_room.participants.add(self.other)
+        Message.objects.create(room=outsider_room, sender=self.other, content='Hi')
+        response = self.client.post(f'/api/v1/chat/rooms/{outsider_room.pk}/mark-read/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(ReadState.objects.filter(room=outsider_room).exists())
+
+    def test_room_list_unread_count(self):
+        """Only other users' messages after the read pointer are unread."""
+        Message.objects.create(room=self.room, sender=self.other, content='One')
+        Message.objects.create(room=self.room, sender=self.user, content='Mine')
+        response = self.client.get('/api/v1/chat/rooms/')
+        self.assertEqual(response.data['results'][0]['unread_count'], 1)
+
+        self.client.post(f'/api/v1/chat/rooms/{self.room.pk}/mark-read/')
+        Message.objects.create(room=self.room, sender=self.other, content='Two')
+        Message.objects.create(room=self.room, sender=self.other, content='Three')
+        response = self.client.get('/api/v1/chat/rooms/')
+        self.assertEqual(response.data['results'][0]['unread_count'], 2)
+
+    def test_room_messages_match_message_serializer(self):
+        """The messages action should render rows exactly as MessageSerializer."""
+        message = Message.objects.create(room=self.room, sender=self.other, content='Hi')
+        response = self.client.get(f'/api/v1/chat/rooms/{self.room.pk}/messages/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'],
+            [MessageSerializer(message).data],
+        )
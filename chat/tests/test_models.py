@@ -68,6 +68,32 @@ class ChatRoomModelTest(TestCase):
         )
         self.assertIn('CHAT101', str(room))
 
+    def test_course_code_copied_and_kept_in_sync(self):
+        """A course room should carry its course code, including renames."""
+        from courses.models import Course
+        teacher = User.objects.create_user(
+            username='code_teacher',
+            email='codeteacher@test.com',
+            password='testpass123',
+            role='teacher',
+        )
+        course = Course.objects.create(
+            teacher=teacher,
+            title='Code Course',
+            code='CODE101',
+            description='Test course for chat.',
+        )
+        room = ChatRoom.objects.create(
+            name='CODE101 Group',
+            room_type=ChatRoom.RoomType.COURSE,
+            course=course,
+        )
+        self.assertEqual(room.course_code, 'CODE101')
+        course.code = 'CODE201'
+        course.save()
+        room.refresh_from_db()
+        self.assertEqual(room.course_code, 'CODE201')
+
 
 class MessageModelTest(TestCase):
     """Tests for the Message model."""
@@ -98,7 +124,6 @@ class MessageModelTest(TestCase):
         )
         self.assertEqual(msg.content, 'Hello there!')
         self.assertEqual(msg.sender, self.user1)
-        self.assertFalse(msg.is_read)
 
     def test_message_ordering(self):
         """Messages should be ordered by timestamp (oldest first)."""
@@ -112,6 +137,15 @@ class MessageModelTest(TestCase):
         self.assertEqual(messages[0], msg1)
         self.assertEqual(messages[1], msg2)
 
+    def test_message_ordering_ties_broken_by_id(self):
+        """Messages saved in the same instant should keep insertion order."""
+        msgs = [
+            Message.objects.create(room=self.room, sender=self.user1, content=str(i))
+            for i in range(3)
+        ]
+        Message.objects.filter(room=self.room).update(timestamp=msgs[0].timestamp)
+        self.assertEqual(list(Message.objects.filter(room=self.room)), msgs)
+
     def test_message_str_representation(self):
         """String should include sender username and truncated content."""
         msg = Message.objects.create(
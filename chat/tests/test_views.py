@@ -6,10 +6,13 @@ including access control and room creation logic.
 """
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from chat.models import ChatRoom
+from chat.models import ChatRoom, Message
 from courses.models import Course, Enrollment
 
 User = get_user_model()
@@ -19,6 +22,8 @@ class ChatRoomListViewTest(TestCase):
     """Tests for the chat room list view."""
 
     def setUp(self):
+        # Room lists are cached; start every test from a clean cache
+        cache.clear()
         self.client = Client()
         self.user = User.objects.create_user(
             username='chat_list_user',
@@ -39,6 +44,52 @@ class ChatRoomListViewTest(TestCase):
         response = self.client.get(reverse('chat-room-list'))
         self.assertEqual(response.status_code, 302)
 
+    def test_room_list_cached_between_loads(self):
+        """A repeat load should be served without touching the database."""
+        url = reverse('chat-room-list')
+        self.client.get(url)
+        # Only the session, user and unread notification count remain
+        with self.assertNumQueries(3):
+            self.client.get(url)
+
+    def test_new_dm_invalidates_room_list(self):
+        """Starting a DM should show up on the next room list load."""
+        other = User.objects.create_user(
+            username='chat_list_other',
+            email='chatlistother@test.com',
+            password='testpass123',
+        )
+        url = reverse('chat-room-list')
+        self.client.get(url)
+        self.client.get(reverse('chat-dm', kwargs={'user_id': other.pk}))
+        response = self.client.get(url)
+        self.assertEqual(len(response.context['dm_rooms']), 1)
+
+    def test_enrollment_invalidates_room_list(self):
+        """Enrolling on a course with a group chat should list that chat."""
+        teacher = User.objects.create_user(
+            username='chat_list_teacher',
+            email='chatlistteacher@test.com',
+            password='testpass123',
+            role='teacher',
+        )
+        course = Course.objects.create(
+            title='Cached Course',
+            code='CC101',
+            description='Test',
+            teacher=teacher,
+        )
+        ChatRoom.objects.create(
+            name='CC101 - Group Chat',
+            room_type=ChatRoom.RoomType.COURSE,
+            course=course,
+        )
+        url = reverse('chat-room-list')
+        self.client.get(url)
+        Enrollment.objects.create(student=self.user, course=course)
+        response = self.client.get(url)
+        self.assertEqual(len(response.context['course_rooms']), 1)
+
 
 class DirectMessageViewTest(TestCase):
     """Tests for the direct message view."""
@@ -84,6 +135,15 @@ class DirectMessageViewTest(TestCase):
         ).count()
         self.assertEqual(room_count_before, room_count_after)
 
+    def test_dm_key_is_order_independent(self):
+        """Both users opening the DM should land in the same room."""
+        self.client.get(reverse('chat-dm', kwargs={'user_id': self.user2.pk}))
+        self.client.login(username='dm_user2', password='testpass123')
+        self.client.get(reverse('chat-dm', kwargs={'user_id': self.user1.pk}))
+        room = ChatRoom.objects.get(room_type=ChatRoom.RoomType.DIRECT)
+        self.assertEqual(room.dm_key, ChatRoom.direct_key(self.user1.pk, self.user2.pk))
+        self.assertEqual(room.participants.count(), 2)
+
 
 class CourseGroupChatViewTest(TestCase):
     """Tests for the course group chat view."""
@@ -128,6 +188,22 @@ class CourseGroupChatViewTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
+    def test_group_chat_room_stores_course_code(self):
+        """The room created on first visit should carry the course code."""
+        self.client.login(username='group_teacher', password='testpass123')
+        self.client.get(reverse('chat-course', kwargs={'course_id': self.course.pk}))
+        room = ChatRoom.objects.get(course=self.course)
+        self.assertEqual(room.course_code, 'CGC101')
+
+    def test_revisiting_group_chat_keeps_single_membership(self):
+        """Opening the chat twice should not duplicate the participant row."""
+        self.client.login(username='group_student', password='testpass123')
+        url = reverse('chat-course', kwargs={'course_id': self.course.pk})
+        self.client.get(url)
+        self.client.get(url)
+        room = ChatRoom.objects.get(course=self.course)
+        self.assertEqual(list(room.participants.all()), [self.student])
+
     def test_unenrolled_student_denied(self):
         """Unenrolled student should be redirected with an error."""
         other = User.objects.create_user(
@@ -141,3 +217,51 @@ class CourseGroupChatViewTest(TestCase):
         response = self.client.get(url)
         # Should redirect (302) to course list with error message
         self.assertEqual(response.status_code, 302)
+
+
+class MessageAdminTest(TestCase):
+    """Tests for the Message admin changelist."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username='chat_admin',
+            email='chatadmin@test.com',
+            password='testpass123',
+        )
+        course = Course.objects.create(
+            teacher=cls.admin,
+            title='Admin Chat Course',
+            code='ACC101',
+            description='Course for message admin testing.',
+        )
+        cls.course_room = ChatRoom.objects.create(
+            name='Admin Chat Course',
+            room_type=ChatRoom.RoomType.COURSE,
+            course=course,
+        )
+        cls.dm_room = ChatRoom.objects.create(
+            name='admin-dm',
+            room_type=ChatRoom.RoomType.DIRECT,
+        )
+
+    def setUp(self):
+        self.client = Client()
+        self.client.login(username='chat_admin', password='testpass123')
+
+    def test_changelist_queries_do_not_grow_per_row(self):
+        """Senders, rooms, courses and content all come from the list query."""
+        url = reverse('admin:chat_message_changelist')
+        Message.objects.create(
+            room=self.course_room, sender=self.admin, content='y' * 100,
+        )
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+        for i in range(4):
+            room = self.course_room if i % 2 else self.dm_room
+            Message.objects.create(
+                room=room, sender=self.admin, content=f'Message {i}',
+            )
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(url)
+        self.assertContains(response, 'y' * 60 + '...')
@@ -7,13 +7,15 @@ defined in consumers.py.
 """
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.db import transaction
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 
 from accounts.models import User
 from courses.models import Course, Enrollment
 
-from .models import ChatRoom
+from .models import ROOM_LIST_CACHE_TIMEOUT, ChatRoom
 
 
 class ChatRoomListView(LoginRequiredMixin, View):
@@ -25,35 +27,42 @@ class ChatRoomListView(LoginRequiredMixin, View):
 
     def get(self, request):
         """List all chat rooms for the authenticated user."""
-        # Get DM rooms the user participates in
-        dm_rooms = ChatRoom.objects.filter(
+        # Membership changes far less often than the page is loaded, so
+        # the room lists are cached per user for a short while
+        cache_key = ChatRoom.room_list_cache_key(request.user.pk)
+        context = cache.get(cache_key)
+        if context is None:
+            context = {
+                'dm_rooms': list(self.get_dm_rooms(request.user)),
+                'course_rooms': list(self.get_course_rooms(request.user)),
+            }
+            cache.set(cache_key, context, ROOM_LIST_CACHE_TIMEOUT)
+        return render(request, 'chat/room_list.html', context)
+
+    def get_dm_rooms(self, user):
+        """Return the DM rooms the user participates in."""
+        return ChatRoom.objects.filter(
             room_type=ChatRoom.RoomType.DIRECT,
-            participants=request.user,
-        ).prefetch_related('participants')
+            participants=user,
+        )
 
-        # Get course group chat rooms the user has access to
-        if request.user.is_teacher:
+    def get_course_rooms(self, user):
+        """Return the course group chat rooms the user has access to."""
+        if user.is_teacher:
             # Teacher sees chat rooms for courses they teach
-            course_rooms = ChatRoom.objects.filter(
-                room_type=ChatRoom.RoomType.COURSE,
-                course__teacher=request.user,
-            ).select_related('course')
-        else:
-            # Student sees chat rooms for courses they are enrolled in
-            enrolled_course_ids = Enrollment.objects.filter(
-                student=request.user,
-                status=Enrollment.Status.ACTIVE,
-            ).values_list('course_id', flat=True)
-            course_rooms = ChatRoom.objects.filter(
+            return ChatRoom.objects.filter(
                 room_type=ChatRoom.RoomType.COURSE,
-                course_id__in=enrolled_course_ids,
+                course__teacher=user,
             ).select_related('course')
-
-        context = {
-            'dm_rooms': dm_rooms,
-            'course_rooms': course_rooms,
-        }
-        return render(request, 'chat/room_list.html', context)
+        # Student sees chat rooms for courses they are enrolled in
+        enrolled_course_ids = Enrollment.objects.filter(
+            student=user,
+            status=Enrollment.Status.ACTIVE,
+        ).values_list('course_id', flat=True)
+        return ChatRoom.objects.filter(
+            room_type=ChatRoom.RoomType.COURSE,
+            course_id__in=enrolled_course_ids,
+        ).select_related('course')
 
 
 class DirectMessageView(LoginRequiredMixin, View):
@@ -71,24 +80,21 @@ class DirectMessageView(LoginRequiredMixin, View):
         if other_user == request.user:
             return redirect('chat-room-list')
 
-        # Find an existing DM room between these two users
-        room = ChatRoom.objects.filter(
-            room_type=ChatRoom.RoomType.DIRECT,
-            participants=request.user,
-        ).filter(
-            participants=other_user,
-        ).first()
-
-        # Create a new DM room if none exists
-        if not room:
-            room = ChatRoom.objects.create(
-                name=f'{request.user.username} & {other_user.username}',
-                room_type=ChatRoom.RoomType.DIRECT,
+        # The unique dm_key makes lookup a single indexed hit and lets
+        # the database reject a concurrent duplicate room for the pair
+        with transaction.atomic():
+            room, created = ChatRoom.objects.get_or_create(
+                dm_key=ChatRoom.direct_key(request.user.pk, other_user.pk),
+                defaults={
+                    'name': f'{request.user.username} & {other_user.username}',
+                    'room_type': ChatRoom.RoomType.DIRECT,
+                },
             )
-            room.participants.add(request.user, other_user)
+            if created:
+                room.add_participants(request.user, other_user)
 
-        # Load message history
-        messages_list = room.messages.order_by('timestamp')[:100]
+        # Load message history with senders joined for the template
+        messages_list = room.messages.select_related('sender').order_by('timestamp', 'id')[:100]
 
         context = {
             'room': room,
@@ -112,7 +118,7 @@ class CourseGroupChatView(LoginRequiredMixin, View):
 
         # Verify the user has access to this course chat
         has_access = (
-            course.teacher == request.user
+            course.teacher_id == request.user.pk
             or Enrollment.objects.filter(
                 student=request.user,
                 course=course,
@@ -126,15 +132,18 @@ class CourseGroupChatView(LoginRequiredMixin, View):
         room, created = ChatRoom.objects.get_or_create(
             course=course,
             room_type=ChatRoom.RoomType.COURSE,
-            defaults={'name': f'{course.code} - Group Chat'},
+            defaults={
+                'name': f'{course.code} - Group Chat',
+                'course_code': course.code,
+            },
         )
 
-        # Ensure the current user is a participant
-        if not room.participants.filter(pk=request.user.pk).exists():
-            room.participants.add(request.user)
+        # Ensure the current user is a participant; existing memberships
+        # are ignored by the insert, so no separate check is needed
+        room.add_participants(request.user)
 
-        # Load message history
-        messages_list = room.messages.order_by('timestamp')[:100]
+        # Load message history with senders joined for the template
+        messages_list = room.messages.select_related('sender').order_by('timestamp', 'id')[:100]
 
         context = {
             'room': room,
@@ -6,16 +6,37 @@ and message sending. These endpoints complement the WebSocket
 interface for clients that prefer HTTP-based communication.
 """
 
+from django.db.models import (
+    Count,
+    F,
+    Max,
+    OuterRef,
+    PositiveBigIntegerField,
+    Prefetch,
+    Subquery,
+    Window,
+)
+from django.db.models.functions import Coalesce, Greatest, RowNumber, Substr
+from django.http import Http404
+from django.utils import timezone
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 
-from .models import ChatRoom, Message
+from accounts.models import User
+from elearning.renderers import ORJSONRenderer
+
+from .models import ChatRoom, Message, ReadState
 from .serializers import (
+    LAST_MESSAGE_PREVIEW_LENGTH,
+    MESSAGE_ONLY_FIELDS,
     ChatRoomDetailSerializer,
     ChatRoomListSerializer,
     MessageSerializer,
     SendMessageSerializer,
+    format_message_rows,
+    message_values,
 )
 
 
@@ -30,12 +51,70 @@ class ChatRoomViewSet(viewsets.ReadOnlyModelViewSet):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    # Actions such as mark_read filter on the raw pk from the URL
+    lookup_value_regex = r'\d+'
 
     def get_queryset(self):
         """Return only rooms the user participates in."""
-        return ChatRoom.objects.filter(
-            participants=self.request.user,
-        ).select_related('course').prefetch_related('participants')
+        queryset = ChatRoom.objects.all()
+        if self.action == 'list':
+            # Count in SQL rather than once per room in the serializer. The
+            # annotation must precede the participant filter below so it
+            # counts over its own join instead of the filtered one. Meta
+            # ordering is ignored on aggregated querysets, so restate it.
+            queryset = queryset.annotate(
+                participant_count=Count('participants'),
+                unread_count=self.unread_count(),
+            ).order_by('-created_at')
+        queryset = queryset.filter(participants=self.request.user)
+        if self.action == 'retrieve':
+            # Only the detail serializer lists participants, by username
+            queryset = queryset.prefetch_related(Prefetch(
+                'participants',
+                queryset=User.objects.only('username'),
+            ))
+        if self.action == 'list':
+            # Fetch the newest message of every listed room in one query:
+            # number each room's messages newest first and keep row 1. Only
+            # the preview of the content is read off each row.
+            newest = Message.objects.annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=F('room_id'),
+                    order_by=[F('timestamp').desc(), F('id').desc()],
+                ),
+                content_preview=Substr('content', 1, LAST_MESSAGE_PREVIEW_LENGTH),
+            ).filter(row_number=1).select_related('sender').only(
+                'room', 'sender__username', 'timestamp',
+            )
+            queryset = queryset.prefetch_related(Prefetch(
+                'messages',
+                queryset=newest,
+                to_attr='latest_messages',
+            ))
+        return queryset
+
+    def unread_count(self):
+        """
+        Return an expression counting the user's unread messages per room.
+
+        Unread means newer than the user's ReadState pointer and sent by
+        someone else. Counted in a subquery so it does not multiply with
+        the participant join.
+        """
+        user = self.request.user
+        last_read = ReadState.objects.filter(
+            room=OuterRef('room'),
+            user=user,
+        ).values('last_read_message_id')
+        unread = Message.objects.filter(
+            room=OuterRef('pk'),
+            id__gt=Coalesce(Subquery(last_read), 0),
+        ).exclude(
+            sender=user,
+        ).order_by().values('room').annotate(count=Count('id')).values('count')
+        return Coalesce(Subquery(unread), 0)
 
     def get_serializer_class(self):
         """Use list serializer for list, detail for retrieve."""
@@ -55,13 +134,13 @@ class ChatRoomViewSet(viewsets.ReadOnlyModelViewSet):
         GET /api/v1/chat/rooms/{id}/messages/
         """
         room = self.get_object()
-        messages = room.messages.select_related('sender').order_by('timestamp')
+        # Plain value rows: the renderer takes them as they are, with no
+        # model instances or serializer fields in between
+        messages = message_values(room.messages.order_by('timestamp', 'id'))
         page = self.paginate_queryset(messages)
         if page is not None:
-            serializer = MessageSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = MessageSerializer(messages, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response(format_message_rows(page))
+        return Response(format_message_rows(messages))
 
     @action(
         detail=True,
@@ -81,15 +160,10 @@ class ChatRoomViewSet(viewsets.ReadOnlyModelViewSet):
         POST /api/v1/chat/rooms/{id}/send/
         Body: {"content": "Hello!"}
         """
+        # get_queryset() only contains the user's own rooms, so get_object()
+        # has already rejected non-participants with a 404
         room = self.get_object()
 
-        # Verify user is a participant
-        if not room.participants.filter(pk=request.user.pk).exists():
-            return Response(
-                {'detail': 'You are not a participant in this room.'},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         serializer = SendMessageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -111,18 +185,42 @@ class ChatRoomViewSet(viewsets.ReadOnlyModelViewSet):
     )
     def mark_read(self, request, pk=None):
         """
-        Mark all messages in this room as read for the current user.
+        Mark every message currently in this room as read for the user.
+
+        Moves the user's ReadState pointer forward to the room's newest
+        message, a single row write however many messages were unread.
 
         POST /api/v1/chat/rooms/{id}/mark-read/
         """
-        room = self.get_object()
-        updated = room.messages.filter(
-            is_read=False,
-        ).exclude(
-            sender=request.user,
-        ).update(is_read=True)
+        is_participant = ChatRoom.participants.through.objects.filter(
+            chatroom_id=pk,
+            user_id=request.user.pk,
+        ).exists()
+        if not is_participant:
+            raise Http404
+        last_id = Message.objects.filter(
+            room_id=pk,
+        ).aggregate(last_id=Max('id'))['last_id'] or 0
+        # Only ever move the pointer forward: an overlapping request that
+        # read an older newest id (another tab) must not undo this one.
+        read_state = ReadState.objects.filter(user=request.user, room_id=pk)
+        advance = {
+            'last_read_message_id': Greatest(
+                'last_read_message_id', last_id,
+                output_field=PositiveBigIntegerField(),
+            ),
+            'updated_at': timezone.now(),
+        }
+        if not read_state.update(**advance):
+            _, created = ReadState.objects.get_or_create(
+                user=request.user,
+                room_id=pk,
+                defaults={'last_read_message_id': last_id},
+            )
+            if not created:
+                read_state.update(**advance)
 
-        return Response({'marked_read': updated})
+        return Response({'last_read_message_id': last_id})
 
 
 class MessageViewSet(viewsets.ReadOnlyModelViewSet):
@@ -137,6 +235,7 @@ class MessageViewSet(viewsets.ReadOnlyModelViewSet):
 
     serializer_class = MessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         """Return messages only from rooms the user is in."""
@@ -145,4 +244,4 @@ class MessageViewSet(viewsets.ReadOnlyModelViewSet):
         )
         return Message.objects.filter(
             room__in=user_rooms,
-        ).select_related('sender', 'room')
+        ).select_related('sender').only(*MESSAGE_ONLY_FIELDS)
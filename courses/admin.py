@@ -21,6 +21,11 @@ class CourseAdmin(admin.ModelAdmin):
     search_fields = ['title', 'code', 'description', 'teacher__username']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['teacher']
+
+    def get_queryset(self, request):
+        """Count active enrollments in the changelist query."""
+        return super().get_queryset(request).with_enrolled_count()
 
 
 @admin.register(Enrollment)
@@ -33,6 +38,7 @@ class EnrollmentAdmin(admin.ModelAdmin):
         'course__title', 'course__code',
     ]
     ordering = ['-enrolled_at']
+    list_select_related = ['student', 'course']
 
 
 @admin.register(CourseMaterial)
@@ -45,15 +51,7 @@ class CourseMaterialAdmin(admin.ModelAdmin):
     list_filter = ['material_type', 'uploaded_at']
     search_fields = ['title', 'description', 'course__title', 'course__code']
     ordering = ['-uploaded_at']
-
-    def file_size_display(self, obj):
-        """Return human-readable file size."""
-        if obj.file_size < 1024:
-            return f'{obj.file_size} B'
-        elif obj.file_size < 1024 * 1024:
-            return f'{obj.file_size / 1024:.1f} KB'
-        return f'{obj.file_size / (1024 * 1024):.1f} MB'
-    file_size_display.short_description = 'File Size'
+    list_select_related = ['course', 'uploaded_by']
 
 
 @admin.register(Feedback)
@@ -63,3 +61,4 @@ class FeedbackAdmin(admin.ModelAdmin):
     list_filter = ['rating', 'created_at']
     search_fields = ['student__username', 'course__title', 'comment']
     ordering = ['-created_at']
+    list_select_related = ['student', 'course']
@@ -9,6 +9,11 @@ from django import forms
 
 from .models import Course, CourseMaterial, Feedback
 
+# Shared Bootstrap attrs. Widgets copy the attrs dict they are given, so
+# one module-level dict can back every widget.
+FORM_CONTROL_ATTRS = {'class': 'form-control'}
+FORM_SELECT_ATTRS = {'class': 'form-select'}
+
 
 class CourseForm(forms.ModelForm):
     """
@@ -22,7 +27,7 @@ class CourseForm(forms.ModelForm):
         model = Course
         fields = ['title', 'code', 'description', 'category', 'max_students', 'is_active']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control'}),
+            'title': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
             'code': forms.TextInput(attrs={
                 'class': 'form-control',
                 'placeholder': 'e.g. CS101',
@@ -35,7 +40,7 @@ class CourseForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'e.g. Computer Science',
             }),
-            'max_students': forms.NumberInput(attrs={'class': 'form-control'}),
+            'max_students': forms.NumberInput(attrs=FORM_CONTROL_ATTRS),
             'is_active': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
         }
 
@@ -52,13 +57,13 @@ class CourseMaterialForm(forms.ModelForm):
         model = CourseMaterial
         fields = ['title', 'description', 'file', 'material_type']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control'}),
+            'title': forms.TextInput(attrs=FORM_CONTROL_ATTRS),
             'description': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 2,
             }),
-            'file': forms.ClearableFileInput(attrs={'class': 'form-control'}),
-            'material_type': forms.Select(attrs={'class': 'form-select'}),
+            'file': forms.ClearableFileInput(attrs=FORM_CONTROL_ATTRS),
+            'material_type': forms.Select(attrs=FORM_SELECT_ATTRS),
         }
 
 
@@ -74,10 +79,7 @@ class FeedbackForm(forms.ModelForm):
         model = Feedback
         fields = ['rating', 'comment']
         widgets = {
-            'rating': forms.Select(
-                choices=[(i, f'{i} Star{"s" if i > 1 else ""}') for i in range(1, 6)],
-                attrs={'class': 'form-select'},
-            ),
+            'rating': forms.Select(attrs=FORM_SELECT_ATTRS),
             'comment': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 4,
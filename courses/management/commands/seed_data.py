@@ -10,9 +10,12 @@ Usage:
 """
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import timezone
 
+from accounts.models import StatusUpdate
 from chat.models import ChatRoom, Message
 from courses.models import Course, CourseMaterial, Enrollment, Feedback
 from notifications.models import Notification
@@ -32,17 +35,48 @@ class Command( BaseCommand):
 
     def handle(self, *args, **options ):
         if options['clear']:
-            self.stdout.write(' Clearing existing data.. .')
-            Message.objects.all().delete()
-            ChatRoom.objects.all().delete()
-            Notification.objects.all().delete()
-            Feedback.objects.all().delete()
-            CourseMaterial.objects.all().delete()
-            Enrollment.objects.all().delete( )
-            Course.objects.all().delete()
-            User.objects.filter(is_superuser=False).delete()
-            self.stdout.write(self.style.SUCCESS('All  data cleared.'))
+            self.clear_data()
+        self.seed()
 
+    @transaction.atomic
+    def clear_data(self):
+        """Delete the existing data, committed on its own before seeding."""
+        self.stdout.write(' Clearing existing data.. .')
+        models = [Message, ChatRoom, Notification, Feedback, CourseMaterial, Enrollment, Course]
+        if connection.vendor == 'postgresql':
+            # TRUNCATE sends no delete signals and RESTART IDENTITY hands
+            # the same course ids to the reseeded courses, so drop their
+            # cached detail payloads once the truncation is committed.
+            course_ids = list(Course.objects.values_list('pk', flat=True))
+            transaction.on_commit(lambda: Course.invalidate_details(course_ids))
+            # One TRUNCATE instead of Django collecting and cascading
+            # every row in Python; CASCADE covers the participant and
+            # read-state tables that reference the chat rooms.
+            tables = ', '.join(
+                connection.ops.quote_name(model._meta.db_table) for model in models
+            )
+            with connection.cursor() as cursor:
+                # Run any foreign key checks still deferred from earlier
+                # writes in an enclosing transaction; TRUNCATE refuses
+                # tables with pending trigger events.
+                cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+                cursor.execute(f'TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE')
+        else:
+            # The collector still loads the rows it cascades from or sends
+            # delete signals for, so fetch only the columns those need.
+            delete_fields = {
+                Enrollment: ['student_id', 'course_id'],
+                CourseMaterial: ['course_id'],
+                Feedback: ['course_id'],
+            }
+            for model in models:
+                model.objects.only('pk', *delete_fields.get(model, [])).delete()
+        User.objects.filter(is_superuser=False).only('pk').delete()
+        self.stdout.write(self.style.SUCCESS('All  data cleared.'))
+
+    @transaction.atomic
+    def seed(self):
+        """Create the sample data in a single transaction and commit."""
         self.stdout.write('Creating seed data...')
 
          
@@ -56,11 +90,12 @@ class Command( BaseCommand):
                 'last_name': 'User',
                 'is_staff': True,
                 'is_superuser': True,
+                # Callable defaults only run on create, so the hash is
+                # skipped for an existing admin and set in the INSERT
+                'password': lambda: make_password('admin123'),
             },
         )
         if created:
-            admin.set_password('admin123')
-            admin.save()
             self.stdout.write(f'  Created admin user: admin / admin123')
 
          
@@ -90,22 +125,15 @@ class Command( BaseCommand):
             },
         ]
 
-        teachers = []
-        for data in teachers_data:
-            dept = data.pop('department')
-            user, created = User.objects.get_or_create(
-                username=data['username'],
-                defaults={**data, 'role': 'teacher'},
-            )
-            if created:
-                user.set_password('teacher123')
-                user.save()
-                # Update the auto-created profile
-                user.profile.department = dept
-                user.profile.bio = f'Professor of {dept} with years of teaching experience.'
-                user.profile.save()
-                self.stdout.write(f'  Created teacher: {user.username} / teacher123')
-            teachers.append(user)
+        teachers = self.create_users(
+            teachers_data,
+            role='teacher',
+            password='teacher123',
+            profile_fields=lambda data: {
+                'department': data['department'],
+                'bio': f'Professor of {data["department"]} with years of teaching experience.',
+            },
+        )
 
          
         # Create students
@@ -148,22 +176,16 @@ class Command( BaseCommand):
             },
         ]
 
-        students = []
-        for data in students_data:
-            sid = data.pop('student_id')
-            user, created = User.objects.get_or_create(
-                username=data['username'],
-                defaults={**data, 'role': 'student'},
-            )
-            if created:
-                user.set_password('student123')
-                user.save()
-                user.profile.student_id = sid
-                user.profile.enrollment_year = 2024
-                user.profile.bio = f'Student passionate about learning new things.'
-                user.profile.save()
-                self.stdout.write(f'  Created student: {user.username} / student123')
-            students.append(user)
+        students = self.create_users(
+            students_data,
+            role='student',
+            password='student123',
+            profile_fields=lambda data: {
+                'student_id': data['student_id'],
+                'enrollment_year': 2024,
+                'bio': 'Student passionate about learning new things.',
+            },
+        )
 
          
         # Create courses
@@ -230,15 +252,17 @@ class Command( BaseCommand):
             },
         ]
 
-        courses = []
-        for data in courses_data:
-            course, created = Course.objects.get_or_create(
-                code=data['code'],
-                defaults=data,
-            )
-            if created:
-                self.stdout.write(f'  Created course: {course.code} - {course.title}')
-            courses.append(course)
+        # One lookup for the existing codes, one INSERT for the rest
+        codes = [data['code'] for data in courses_data]
+        existing = Course.objects.in_bulk(codes, field_name='code')
+        created = Course.objects.bulk_create([
+            Course(**data) for data in courses_data if data['code'] not in existing
+        ])
+        existing.update((course.code, course) for course in created)
+        self.write_lines(
+            f'  Created course: {course.code} - {course.title}' for course in created
+        )
+        courses = [existing[code] for code in codes]
 
          
         # Create enrollments
@@ -266,16 +290,27 @@ class Command( BaseCommand):
             (students[4], courses[4]),
         ]
 
-        for student, course in enrollment_pairs:
-            enrollment, created = Enrollment.objects.get_or_create(
-                student=student,
-                course=course,
-                defaults={'status': Enrollment.Status.ACTIVE},
-            )
-            if created:
-                self.stdout.write(
-                    f'  Enrolled {student.username} in {course.code}'
-                )
+        # Look up the existing pairs once, then insert the rest together.
+        # bulk_create skips the enrollment signal, so seeding does not
+        # queue a notification task per enrollment.
+        existing = set(Enrollment.objects.filter(
+            student__in=students,
+        ).values_list('student_id', 'course_id'))
+        new_pairs = [
+            (student, course) for student, course in enrollment_pairs
+            if (student.pk, course.pk) not in existing
+        ]
+        Enrollment.objects.bulk_create(
+            [
+                Enrollment(student=student, course=course, status=Enrollment.Status.ACTIVE)
+                for student, course in new_pairs
+            ],
+            ignore_conflicts=True,
+        )
+        self.write_lines(
+            f'  Enrolled {student.username} in {course.code}'
+            for student, course in new_pairs
+        )
 
          
         # Create feedback
@@ -291,21 +326,31 @@ class Command( BaseCommand):
             (students[4], courses[4], 4, 'Great introduction to machine learning concepts.') ,
         ]
 
-        for student, course, rating, comment in feedback_data:
-            fb, created = Feedback.objects.get_or_create(
-                student=student,
-                course=course,
-                defaults={'rating': rating, 'comment': comment},
-            )
-            if created:
-                self.stdout.write(
-                    f'  Feedback by {student.username} for {course.code}: {rating}/5'
-                )
+        existing = set(Feedback.objects.filter(
+            student__in=students,
+        ).values_list('student_id', 'course_id'))
+        new_feedback = [
+            Feedback(student=student, course=course, rating=rating, comment=comment)
+            for student, course, rating, comment in feedback_data
+            if (student.pk, course.pk) not in existing
+        ]
+        Feedback.objects.bulk_create(new_feedback, ignore_conflicts=True)
+        self.write_lines(
+            f'  Feedback by {fb.student.username} for {fb.course.code}: {fb.rating}/5'
+            for fb in new_feedback
+        )
+
+        # bulk_create skips the signals that drop cached course details,
+        # so clear the courses whose rows, counts or ratings just changed
+        changed_course_ids = (
+            {course.pk for course in created}
+            | {course.pk for _, course in new_pairs}
+            | {fb.course_id for fb in new_feedback}
+        )
+        transaction.on_commit(lambda: Course.invalidate_details(changed_course_ids))
 
     
         # Create status updates
-        from accounts.models import StatusUpdate
-
         status_data = [
             (teachers[0], 'Just uploaded new Python exercises for CS101. Check them out!'),
             (teachers[1], 'Office hours this Thursday 2-4 PM in Room 301.'),
@@ -315,11 +360,14 @@ class Command( BaseCommand):
             (students[2], 'The CS101 Python course is fantastic so far.'),
         ]
 
-        for user, content in status_data:
-            StatusUpdate.objects.get_or_create(
-                user=user,
-                content=content,
-            )
+        existing = set(StatusUpdate.objects.filter(
+            user__in=[user for user, _ in status_data],
+        ).values_list('user_id', 'content'))
+        StatusUpdate.objects.bulk_create([
+            StatusUpdate(user=user, content=content)
+            for user, content in status_data
+            if (user.pk, content) not in existing
+        ])
 
          
         # Create chat rooms and sample messages
@@ -332,79 +380,83 @@ class Command( BaseCommand):
                 'room_type': ChatRoom.RoomType.COURSE,
             },
         )
-        cs101_room.participants.add(teachers[0], students[0], students[1], students[2], students[3])
+        cs101_room.add_participants(teachers[0], students[0], students[1], students[2], students[3])
 
         # DM between alice and prof_smith
         dm_room, dm_created = ChatRoom.objects.get_or_create(
-            name='alice-prof_smith',
-            room_type=ChatRoom.RoomType.DIRECT,
+            dm_key=ChatRoom.direct_key(students[0].pk, teachers[0].pk),
+            defaults={
+                'name': 'alice-prof_smith',
+                'room_type': ChatRoom.RoomType.DIRECT,
+            },
         )
         if dm_created:
-            dm_room.participants.add(students[0], teachers[0])
-
-        # Sample messages
-        if not Message.objects.filter(room=cs101_room).exists():
-            Message.objects.create(
-                room=cs101_room,
-                sender=teachers[0],
-                content='Welcome to the CS101 group chat! Feel free to ask questions here.',
-            )
-            Message.objects.create(
-                room=cs101_room,
-                sender=students[0],
-                content='Thanks Professor! Quick question about the first assignment.',
-            )
-            Message.objects.create(
-                room=cs101_room,
-                sender=teachers[0],
-                content='Of course, go ahead Alice.',
-            )
-            self.stdout.write('  Created sample chat messages.')
+            dm_room.add_participants(students[0], teachers[0])
 
-        if not Message.objects.filter(room=dm_room).exists():
-            Message.objects.create(
-                room=dm_room,
-                sender=students[0],
-                content='Hi Professor, could I get an extension on the assignment?',
-            )
-            Message.objects.create(
-                room=dm_room,
-                sender=teachers[0],
-                content='Hi Alice, sure. I can give you until Friday. Does that work?',
-            )
+        # Sample messages for rooms that have none yet, in a single INSERT.
+        # bulk_create still fills in the timestamps and ties between them
+        # are ordered by id.
+        sample_messages = {
+            cs101_room: [
+                (teachers[0], 'Welcome to the CS101 group chat! Feel free to ask questions here.'),
+                (students[0], 'Thanks Professor! Quick question about the first assignment.'),
+                (teachers[0], 'Of course, go ahead Alice.'),
+            ],
+            dm_room: [
+                (students[0], 'Hi Professor, could I get an extension on the assignment?'),
+                (teachers[0], 'Hi Alice, sure. I can give you until Friday. Does that work?'),
+            ],
+        }
+        rooms_with_messages = set(Message.objects.filter(
+            room__in=sample_messages,
+        ).values_list('room_id', flat=True).distinct())
+        new_messages = [
+            Message(room=room, sender=sender, content=content)
+            for room, messages in sample_messages.items()
+            if room.pk not in rooms_with_messages
+            for sender, content in messages
+        ]
+        if new_messages:
+            Message.objects.bulk_create(new_messages)
+            self.stdout.write('  Created sample chat messages.')
 
          
         # Create sample notifications
-        notif_data =  [
+        cs101_link = courses[0].get_absolute_url()
+        notif_data = [
             {
                 'recipient': teachers[0],
                 'notification_type': 'enrollment',
                 'title': 'New Enrollment in CS101',
                 'message': 'Alice Anderson has enrolled in Introduction to Python Programming.',
-                'link': f'/courses/{courses[0].pk}/',
+                'link': cs101_link,
             },
             {
                 'recipient': students[0],
                 'notification_type': 'new_material',
                 'title': 'New Material in CS101',
                 'message': 'Professor Smith uploaded "Week 1 Lecture Notes" to CS101.',
-                'link': f'/courses/{courses[0].pk}/',
+                'link': cs101_link,
             },
             {
                 'recipient': teachers[0],
                 'notification_type': 'feedback',
                 'title': 'New Feedback on CS101',
                 'message': 'Alice Anderson left a 5-star review on your course.',
-                'link': f'/courses/{courses[0].pk}/',
+                'link': cs101_link,
             },
         ]
 
-        for data in notif_data:
-            Notification.objects.get_or_create(
-                recipient=data['recipient'],
-                title=data['title'],
-                defaults=data,
-            )
+        # Look up which (recipient, title) pairs exist in one query and
+        # insert the rest together.
+        existing_notifs = set(Notification.objects.filter(
+            recipient__in={data['recipient'] for data in notif_data},
+            title__in={data['title'] for data in notif_data},
+        ).values_list('recipient_id', 'title'))
+        Notification.objects.bulk_create([
+            Notification(**data) for data in notif_data
+            if (data['recipient'].pk, data['title']) not in existing_notifs
+        ])
 
         self.stdout.write(self.style.SUCCESS(
             '\nSeed data created successfully!\n\n'
@@ -419,3 +471,42 @@ class Command( BaseCommand):
             '            diana / student123\n'
             '            edward / student123\n'
         ))
+
+    def create_users(self, users_data, role, password, profile_fields):
+        """
+        Return the seed users for one role, creating any that are missing.
+
+        Existing users are found with one query and the rest are inserted,
+        profiles included, in one batch. The password is hashed once and
+        the hash shared, rather than paying the hasher's cost per user.
+        """
+        usernames = [data['username'] for data in users_data]
+        existing = User.objects.in_bulk(usernames, field_name='username')
+        missing = [data for data in users_data if data['username'] not in existing]
+        if missing:
+            password_hash = make_password(password)
+            created = User.objects.bulk_create_with_profiles(
+                [
+                    User(
+                        username=data['username'],
+                        email=data['email'],
+                        first_name=data['first_name'],
+                        last_name=data['last_name'],
+                        role=role,
+                        password=password_hash,
+                    )
+                    for data in missing
+                ],
+                profile_fields=[profile_fields(data) for data in missing],
+            )
+            existing.update((user.username, user) for user in created)
+            self.write_lines(
+                f'  Created {role}: {user.username} / {password}' for user in created
+            )
+        return [existing[username] for username in usernames]
+
+    def write_lines(self, lines):
+        """Write a batch of progress lines to stdout in a single call."""
+        lines = list(lines)
+        if lines:
+            self.stdout.write('\n'.join(lines))
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:22
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_coursematerial_material_course_uploaded_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='max_students',
+            field=models.PositiveSmallIntegerField(default=50, help_text='Maximum number of students that can enrol.'),
+        ),
+        migrations.AlterField(
+            model_name='feedback',
+            name='rating',
+            field=models.PositiveSmallIntegerField(help_text='Rating from 1 (poor) to 5 (excellent).', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)]),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:22
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0003_alter_course_max_students_alter_feedback_rating'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feedback',
+            name='rating',
+            field=models.PositiveSmallIntegerField(choices=[(1, '1 Star'), (2, '2 Stars'), (3, '3 Stars'), (4, '4 Stars'), (5, '5 Stars')], help_text='Rating from 1 (poor) to 5 (excellent).', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)]),
+        ),
+    ]
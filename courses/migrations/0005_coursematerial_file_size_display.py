@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:25
+
+from django.db import migrations, models
+
+
+def format_file_size(size):
+    # Frozen copy of CourseMaterial.format_file_size()
+    if size < 1024:
+        return f'{size} B'
+    if size < 1024 * 1024:
+        return f'{size / 1024:.1f} KB'
+    return f'{size / (1024 * 1024):.1f} MB'
+
+
+def fill_file_size_display(apps, schema_editor):
+    CourseMaterial = apps.get_model('courses', 'CourseMaterial')
+    materials = list(CourseMaterial.objects.only('file_size'))
+    for material in materials:
+        material.file_size_display = format_file_size(material.file_size)
+    CourseMaterial.objects.bulk_update(materials, ['file_size_display'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_alter_feedback_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursematerial',
+            name='file_size_display',
+            field=models.CharField(blank=True, editable=False, help_text='Human-readable file size, set alongside file_size.', max_length=16, verbose_name='file size'),
+        ),
+        migrations.RunPython(fill_file_size_display, migrations.RunPython.noop),
+    ]
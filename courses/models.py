@@ -8,11 +8,76 @@ and students leave feedback.
 """
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import (
+    Avg, BooleanField, Case, Count, F, OuterRef, Q, Subquery, When,
+)
+from django.db.models.functions import Coalesce, Round
+from django.urls import reverse
 
 from .validators import validate_file_extension, validate_file_size
 
+# Seconds a rendered course detail stays cached; the courses signals
+# drop it sooner whenever the course, its teacher's name, or its
+# enrollments, materials or feedback change
+COURSE_DETAIL_CACHE_TIMEOUT = 300
+
+
+class CourseQuerySet(models.QuerySet):
+    """QuerySet for Course with annotations used by listing pages."""
+
+    def with_enrolled_count(self):
+        """
+        Annotate each course with its number of active enrollments and
+        whether that count has reached max_students.
+
+        Course.enrolled_count and is_full read the annotations when they
+        are present, so listing N courses costs one query instead of N
+        extra COUNTs, and callers can filter or order on at_capacity.
+        """
+        return self.annotate(
+            active_enrollment_count=Count(
+                'enrollments',
+                filter=Q(enrollments__status=Enrollment.Status.ACTIVE),
+            ),
+            at_capacity=Case(
+                When(active_enrollment_count__gte=F('max_students'), then=True),
+                default=False,
+                output_field=BooleanField(),
+            ),
+        )
+
+    def with_detail_stats(self):
+        """
+        Annotate each course's material count and average rating (to one
+        decimal, or None without feedback) for the course detail API.
+
+        Course.materials_count and average_rating read the annotations
+        when present. Both are correlated subqueries rather than joins,
+        so they do not multiply the rows counted by with_enrolled_count().
+        """
+        materials = CourseMaterial.objects.filter(
+            course=OuterRef('pk'),
+        ).order_by().values('course').annotate(count=Count('pk')).values('count')
+        ratings = Feedback.objects.filter(
+            course=OuterRef('pk'),
+        ).order_by().values('course').annotate(
+            average=Round(Avg('rating'), 1),
+        ).values('average')
+        return self.annotate(
+            material_total=Coalesce(Subquery(materials), 0),
+            rating_average=Subquery(ratings),
+        )
+
+    def default_related(self):
+        """
+        Load what course pages render alongside each course: the teacher
+        in the same JOIN, plus the enrollment annotations above.
+        """
+        return self.select_related('teacher').with_enrolled_count()
+
 
 class Course(models.Model):
     """
@@ -44,7 +109,7 @@ class Course(models.Model):
         blank=True,
         help_text='Subject category, e.g. "Computer Science", "Mathematics".',
     )
-    max_students = models.PositiveIntegerField(
+    max_students = models.PositiveSmallIntegerField(
         default=50,
         help_text='Maximum number of students that can enrol.',
     )
@@ -55,22 +120,77 @@ class Course(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CourseQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Course'
         verbose_name_plural = 'Courses'
+        indexes = [
+            # Serves the newest-first catalogue and its cursor pagination
+            models.Index(fields=['-created_at'], name='course_created_idx'),
+        ]
 
     def __str__(self):
         return f'{self.code} - {self.title}'
 
+    def get_absolute_url(self):
+        return reverse('course-detail', kwargs={'pk': self.pk})
+
+    @staticmethod
+    def detail_cache_key(course_id):
+        """Return the cache key holding the course's API detail payload."""
+        return f'courses:detail:{course_id}'
+
+    @classmethod
+    def invalidate_details(cls, course_ids):
+        """Drop the cached API detail payloads of the given courses."""
+        cache.delete_many([cls.detail_cache_key(pk) for pk in course_ids])
+
     @property
     def enrolled_count(self):
-        """Return the number of actively enrolled students."""
+        """
+        Return the number of actively enrolled students.
+
+        Uses the with_enrolled_count() annotation when the course was
+        loaded with it, and falls back to a COUNT query otherwise.
+        """
+        if hasattr(self, 'active_enrollment_count'):
+            return self.active_enrollment_count
         return self.enrollments.filter(status=Enrollment.Status.ACTIVE).count()
 
+    @property
+    def materials_count(self):
+        """
+        Return the number of uploaded materials.
+
+        Uses the with_detail_stats() annotation when present, and falls
+        back to a COUNT query otherwise.
+        """
+        if hasattr(self, 'material_total'):
+            return self.material_total
+        return self.materials.count()
+
+    @property
+    def average_rating(self):
+        """
+        Return the average feedback rating to one decimal, or None if
+        the course has no feedback.
+
+        Uses the with_detail_stats() annotation when present, and falls
+        back to a single AVG query otherwise.
+        """
+        if hasattr(self, 'rating_average'):
+            return self.rating_average
+        return self.feedbacks.aggregate(
+            average=Round(Avg('rating'), 1),
+        )['average']
+
     @property
     def is_full(self):
         """Return True if the course has reached its enrollment capacity."""
+        if hasattr(self, 'at_capacity'):
+            return self.at_capacity
         return self.enrolled_count >= self.max_students
 
 
@@ -114,6 +234,18 @@ class Enrollment(models.Model):
         ordering = ['-enrolled_at']
         verbose_name = 'Enrollment'
         verbose_name_plural = 'Enrollments'
+        indexes = [
+            # Serves active-enrollment counts and rosters per course
+            models.Index(
+                fields=['course', 'status'],
+                name='enroll_course_status_idx',
+            ),
+            # Serves a student's active courses (dashboard, chat rooms)
+            models.Index(
+                fields=['student', 'status'],
+                name='enroll_student_status_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.student.username} -> {self.course.code} [{self.status}]'
@@ -128,13 +260,12 @@ class CourseMaterial(models.Model):
     images, documents, and other common file types with size validation.
     """
 
-    MATERIAL_TYPES = [
-        ('pdf', 'PDF Document'),
-        ('image', 'Image'),
-        ('video', 'Video'),
-        ('document', 'Document'),
-        ('other', 'Other'),
-    ]
+    class MaterialType(models.TextChoices):
+        PDF = 'pdf', 'PDF Document'
+        IMAGE = 'image', 'Image'
+        VIDEO = 'video', 'Video'
+        DOCUMENT = 'document', 'Document'
+        OTHER = 'other', 'Other'
 
     course = models.ForeignKey(
         Course,
@@ -157,31 +288,79 @@ class CourseMaterial(models.Model):
     )
     material_type = models.CharField(
         max_length=20,
-        choices=MATERIAL_TYPES,
-        default='other',
+        choices=MaterialType.choices,
+        default=MaterialType.OTHER,
     )
     file_size = models.PositiveIntegerField(
         editable=False,
         default=0,
         help_text='File size in bytes, set automatically on save.',
     )
+    file_size_display = models.CharField(
+        'file size',
+        max_length=16,
+        editable=False,
+        blank=True,
+        help_text='Human-readable file size, set alongside file_size.',
+    )
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-uploaded_at']
         verbose_name = 'Course Material'
         verbose_name_plural = 'Course Materials'
+        indexes = [
+            # Serves a course's materials, newest first
+            models.Index(
+                fields=['course', '-uploaded_at'],
+                name='material_course_uploaded_idx',
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored file name so save() can tell if it changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_file_name = dict(zip(field_names, values)).get('file')
+        return instance
+
+    @staticmethod
+    def format_file_size(size):
+        """Return a byte count as a human-readable string, e.g. '1.2 MB'."""
+        if size < 1024:
+            return f'{size} B'
+        if size < 1024 * 1024:
+            return f'{size / 1024:.1f} KB'
+        return f'{size / (1024 * 1024):.1f} MB'
 
     def save(self, *args, **kwargs):
-        """Override save to automatically record the file size."""
-        if self.file:
+        """
+        Override save to automatically record the file size, raw and
+        formatted for display.
+
+        The size is only read when the file is new or replaced (or was
+        never recorded): on remote storage every read is a request.
+        """
+        file_changed = self.file.name != getattr(self, '_loaded_file_name', None)
+        if self.file and (file_changed or not self.file_size):
             self.file_size = self.file.size
+            self.file_size_display = self.format_file_size(self.file_size)
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.title} ({self.course.code})'
 
 
+# Feedback ratings run from one to five stars; the model validators, the
+# choices and the rating form all read these.
+MIN_RATING = 1
+MAX_RATING = 5
+RATING_CHOICES = tuple(
+    (i, f'{i} Star{"s" if i > 1 else ""}')
+    for i in range(MIN_RATING, MAX_RATING + 1)
+)
+
+
 class Feedback(models.Model):
     """
     Student feedback and rating for a course.
@@ -201,8 +380,9 @@ class Feedback(models.Model):
         on_delete=models.CASCADE,
         related_name='feedbacks_given',
     )
-    rating = models.PositiveIntegerField(
-        validators=[MinValueValidator(1), MaxValueValidator(5)],
+    rating = models.PositiveSmallIntegerField(
+        choices=RATING_CHOICES,
+        validators=[MinValueValidator(MIN_RATING), MaxValueValidator(MAX_RATING)],
         help_text='Rating from 1 (poor) to 5 (excellent).',
     )
     comment = models.TextField(
@@ -217,6 +397,13 @@ class Feedback(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Feedback'
         verbose_name_plural = 'Feedbacks'
+        indexes = [
+            # Serves a course's feedback, newest first
+            models.Index(
+                fields=['course', '-created_at'],
+                name='feedback_course_created_idx',
+            ),
+        ]
 
     def __str__(self):
-        return f'{self.student.username} -> {self.course.code}: {self.rating}/5'
+        return f'{self.student.username} -> {self.course.code}: {self.rating}/{MAX_RATING}'
@@ -6,15 +6,140 @@ Feedback models. Includes nested teacher data, computed fields for
 enrollment counts, and write serializers for creation endpoints.
 """
 
+import copy
+
 from django.contrib.auth import get_user_model
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 
 from .models import Course, CourseMaterial, Enrollment, Feedback
 
 User = get_user_model()
 
+# Columns EnrollmentSerializer reads; pass to .only() with
+# select_related('student', 'course')
+ENROLLMENT_ONLY_FIELDS = (
+    'student__username', 'student__first_name', 'student__last_name',
+    'course__code', 'course__title', 'status', 'enrolled_at', 'dropped_at',
+)
+
+# Columns FeedbackSerializer reads; pass to .only() with
+# select_related('course', 'student')
+FEEDBACK_ONLY_FIELDS = (
+    'course__code', 'student__username', 'rating', 'comment', 'created_at',
+)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and give each instance
+    shallow copies of them.
+
+    DRF deep-copies the declared fields and re-introspects the model
+    every time a serializer is instantiated. The serializers below never
+    change their fields per instance, so the built set can be reused;
+    each copy is still bound to its own serializer.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsMixin._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
+# Formats timestamps the way the serializers' DateTimeFields do
+_timestamp_field = serializers.DateTimeField()
 
-class CourseListSerializer(serializers.ModelSerializer):
+
+def _full_name(first_name, last_name):
+    """Join a name the way User.get_full_name() does."""
+    return f'{first_name} {last_name}'.strip()
+
+
+def course_values(queryset):
+    """
+    Return a with_enrolled_count() course queryset as .values() rows
+    for format_course_rows(), skipping Course and User instances.
+    """
+    return queryset.values(
+        'id', 'title', 'code', 'description', 'category', 'max_students',
+        'is_active', 'created_at',
+        teacher_first_name=F('teacher__first_name'),
+        teacher_last_name=F('teacher__last_name'),
+        teacher_username=F('teacher__username'),
+        enrolled_count=F('active_enrollment_count'),
+    )
+
+
+def format_course_row(row):
+    """Shape a course_values() row exactly as CourseListSerializer would."""
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'code': row['code'],
+        'description': row['description'],
+        'category': row['category'],
+        'max_students': row['max_students'],
+        'is_active': row['is_active'],
+        'teacher_name': _full_name(
+            row['teacher_first_name'], row['teacher_last_name'],
+        ),
+        'teacher_username': row['teacher_username'],
+        'enrolled_count': row['enrolled_count'],
+        'created_at': _timestamp_field.to_representation(row['created_at']),
+    }
+
+
+def format_course_rows(rows):
+    """Shape course_values() rows exactly as CourseListSerializer would."""
+    return [format_course_row(row) for row in rows]
+
+
+def enrollment_values(queryset):
+    """
+    Return an enrollment queryset as .values() rows for
+    format_enrollment_rows(), skipping model instances.
+    """
+    return queryset.values(
+        'id', 'student', 'course', 'status', 'enrolled_at', 'dropped_at',
+        student_username=F('student__username'),
+        student_first_name=F('student__first_name'),
+        student_last_name=F('student__last_name'),
+        course_code=F('course__code'),
+        course_title=F('course__title'),
+    )
+
+
+def format_enrollment_rows(rows):
+    """Shape enrollment_values() rows exactly as EnrollmentSerializer would."""
+    return [
+        {
+            'id': row['id'],
+            'student': row['student'],
+            'student_username': row['student_username'],
+            'student_name': _full_name(
+                row['student_first_name'], row['student_last_name'],
+            ),
+            'course': row['course'],
+            'course_code': row['course_code'],
+            'course_title': row['course_title'],
+            'status': row['status'],
+            'enrolled_at': _timestamp_field.to_representation(row['enrolled_at']),
+            'dropped_at': (
+                _timestamp_field.to_representation(row['dropped_at'])
+                if row['dropped_at'] is not None else None
+            ),
+        }
+        for row in rows
+    ]
+
+
+class CourseListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for course list endpoints.
 
@@ -50,7 +175,7 @@ class CourseListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class CourseDetailSerializer(serializers.ModelSerializer):
+class CourseDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Full serializer for course detail endpoints.
 
@@ -67,8 +192,8 @@ class CourseDetailSerializer(serializers.ModelSerializer):
         read_only=True,
     )
     enrolled_count = serializers.IntegerField(read_only=True)
-    materials_count = serializers.SerializerMethodField()
-    average_rating = serializers.SerializerMethodField()
+    materials_count = serializers.IntegerField(read_only=True)
+    average_rating = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Course
@@ -93,20 +218,8 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             'id', 'teacher', 'created_at', 'updated_at',
         ]
 
-    def get_materials_count(self, obj):
-        """Return the total number of uploaded materials for this course."""
-        return obj.materials.count()
 
-    def get_average_rating(self, obj):
-        """Return the average feedback rating, or None if no ratings exist."""
-        feedbacks = obj.feedbacks.all()
-        if not feedbacks.exists():
-            return None
-        total = sum(f.rating for f in feedbacks)
-        return round(total / feedbacks.count(), 1)
-
-
-class CourseCreateSerializer(serializers.ModelSerializer):
+class CourseCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for course creation.
 
@@ -128,7 +241,7 @@ class CourseCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for enrollment records.
 
@@ -172,7 +285,7 @@ class EnrollmentSerializer(serializers.ModelSerializer):
         ]
 
 
-class EnrollmentCreateSerializer(serializers.Serializer):
+class EnrollmentCreateSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for enrollment creation via API.
 
@@ -182,36 +295,42 @@ class EnrollmentCreateSerializer(serializers.Serializer):
 
     course_id = serializers.IntegerField()
 
-    def validate_course_id(self, value):
-        """Ensure the course exists and is active."""
-        try:
-            course = Course.objects.get(pk=value, is_active=True)
-        except Course.DoesNotExist:
-            raise serializers.ValidationError(
-                'Course not found or is not active.'
-            )
-        return value
-
     def validate(self, attrs):
-        """Check enrollment eligibility."""
-        course = Course.objects.get(pk=attrs['course_id'])
+        """
+        Check enrollment eligibility against a single, locked course row.
+
+        The course comes back annotated with its active enrollment count
+        and the student's existing enrollment status, if any. Called
+        inside a transaction, select_for_update() makes concurrent
+        enrollments on the same course queue up behind the capacity
+        check instead of racing past it.
+        """
         student = self.context['request'].user
-
-        # Check if already enrolled
-        existing = Enrollment.objects.filter(
+        active_count = Enrollment.objects.filter(
+            course=OuterRef('pk'),
+            status=Enrollment.Status.ACTIVE,
+        ).order_by().values('course').annotate(count=Count('pk')).values('count')
+        existing_status = Enrollment.objects.filter(
+            course=OuterRef('pk'),
             student=student,
-            course=course,
-        ).first()
-
-        if existing:
-            if existing.status == Enrollment.Status.ACTIVE:
-                raise serializers.ValidationError(
-                    'You are already enrolled in this course.'
-                )
-            if existing.status == Enrollment.Status.BLOCKED:
-                raise serializers.ValidationError(
-                    'You have been blocked from this course.'
-                )
+        ).values('status')[:1]
+        course = Course.objects.select_for_update().annotate(
+            active_enrollment_count=Coalesce(Subquery(active_count), 0),
+            student_status=Subquery(existing_status),
+        ).filter(pk=attrs['course_id'], is_active=True).first()
+        if course is None:
+            raise serializers.ValidationError(
+                {'course_id': ['Course not found or is not active.']}
+            )
+
+        if course.student_status == Enrollment.Status.ACTIVE:
+            raise serializers.ValidationError(
+                'You are already enrolled in this course.'
+            )
+        if course.student_status == Enrollment.Status.BLOCKED:
+            raise serializers.ValidationError(
+                'You have been blocked from this course.'
+            )
 
         # Check capacity
         if course.is_full:
@@ -223,7 +342,7 @@ class EnrollmentCreateSerializer(serializers.Serializer):
         return attrs
 
 
-class CourseMaterialSerializer(serializers.ModelSerializer):
+class CourseMaterialSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for course material records.
 
@@ -235,7 +354,6 @@ class CourseMaterialSerializer(serializers.ModelSerializer):
         source='uploaded_by.username',
         read_only=True,
     )
-    file_size_display = serializers.SerializerMethodField()
 
     class Meta:
         model = CourseMaterial
@@ -253,20 +371,12 @@ class CourseMaterialSerializer(serializers.ModelSerializer):
             'uploaded_at',
         ]
         read_only_fields = [
-            'id', 'course', 'file_size', 'uploaded_by', 'uploaded_at',
+            'id', 'course', 'file_size', 'file_size_display', 'uploaded_by',
+            'uploaded_at',
         ]
 
-    def get_file_size_display(self, obj):
-        """Return a human-readable file size string."""
-        if obj.file_size < 1024:
-            return f'{obj.file_size} B'
-        elif obj.file_size < 1024 * 1024:
-            return f'{obj.file_size / 1024:.1f} KB'
-        else:
-            return f'{obj.file_size / (1024 * 1024):.1f} MB'
-
 
-class FeedbackSerializer(serializers.ModelSerializer):
+class FeedbackSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for course feedback records.
 
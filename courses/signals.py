@@ -7,12 +7,16 @@ Triggers notification creation when:
 
 Uses Celery tasks for async dispatch in production. In development,
 CELERY_TASK_ALWAYS_EAGER=True ensures these run synchronously.
+
+Also drops a course's cached API detail whenever anything it shows
+changes.
 """
 
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import CourseMaterial, Enrollment
+from .models import Course, CourseMaterial, Enrollment, Feedback
 
 
 @receiver(post_save, sender=Enrollment)
@@ -57,3 +61,38 @@ def notify_students_on_new_material(sender, instance, created, **kwargs):
             ),
             link=f'/courses/{instance.course_id}/',
         )
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_detail(sender, instance, **kwargs):
+    """The detail payload shows the course's own fields."""
+    Course.invalidate_details([instance.pk])
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+@receiver(post_save, sender=CourseMaterial)
+@receiver(post_delete, sender=CourseMaterial)
+@receiver(post_save, sender=Feedback)
+@receiver(post_delete, sender=Feedback)
+def invalidate_course_detail_counts(sender, instance, **kwargs):
+    """The detail payload counts enrollments and materials and averages ratings."""
+    Course.invalidate_details([instance.course_id])
+
+
+# User fields shown in a course detail payload (as teacher_name/_username)
+TEACHER_DETAIL_FIELDS = {'username', 'first_name', 'last_name'}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_taught_course_details(sender, instance, update_fields=None, **kwargs):
+    """The detail payload shows the teacher's name and username."""
+    if not instance.is_teacher:
+        return
+    # Logins save only last_login; skip the course lookup for those
+    if update_fields is not None and not TEACHER_DETAIL_FIELDS & set(update_fields):
+        return
+    Course.invalidate_details(
+        Course.objects.filter(teacher=instance).values_list('pk', flat=True),
+    )
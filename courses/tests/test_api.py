@@ -5,12 +5,18 @@ Tests the Course, Enrollment, Material, and Feedback API ViewSets
 including role-based access control and CRUD operations.
 """
 
+import json
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
-from courses.models import Course, Enrollment
+from courses.models import Course, Enrollment, Feedback
+from courses.serializers import CourseListSerializer, EnrollmentSerializer
 
 User = get_user_model()
 
@@ -19,6 +25,8 @@ class CourseAPITest(APITestCase):
     """Tests for the Course API endpoints."""
 
     def setUp(self):
+        # Course details are cached; start every test from a clean cache
+        cache.clear()
         self.teacher = User.objects.create_user(
             username='api_course_teacher',
             email='apicourseteacher@test.com',
@@ -98,6 +106,101 @@ class CourseAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['code'], 'API101')
 
+    def test_course_detail_aggregates(self):
+        """Course detail reports the material count and rounded average rating."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        url = f'/api/v1/courses/courses/{self.course.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(response.data['materials_count'], 0)
+        self.assertIsNone(response.data['average_rating'])
+
+        other = User.objects.create_user(
+            username='api_course_student2',
+            email='apicoursestudent2@test.com',
+            password='testpass123',
+            role='student',
+        )
+        for student, rating in [(self.student, 5), (other, 4)]:
+            Feedback.objects.create(
+                course=self.course, student=student, rating=rating, comment='Ok.',
+            )
+        response = self.client.get(url)
+        self.assertEqual(response.data['average_rating'], 4.5)
+
+    def test_course_detail_etag(self):
+        """A matching If-None-Match gets a 304 until the course changes."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        url = f'/api/v1/courses/courses/{self.course.pk}/'
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Enrollment.objects.create(student=self.student, course=self.course)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['enrolled_count'], 1)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_course_detail_cache_follows_changes(self):
+        """Zero-padded ids share the cached entry, and teacher renames drop it."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        padded_url = f'/api/v1/courses/courses/0{self.course.pk}/'
+        self.client.get(padded_url)
+        self.course.title = 'Renamed Course'
+        self.course.save()
+        self.assertEqual(self.client.get(padded_url).data['title'], 'Renamed Course')
+
+        self.teacher.first_name = 'Grace'
+        self.teacher.last_name = 'Hopper'
+        self.teacher.save()
+        response = self.client.get(f'/api/v1/courses/courses/{self.course.pk}/')
+        self.assertEqual(response.data['teacher_name'], 'Grace Hopper')
+
+    def test_export_streams_filtered_courses(self):
+        """The export streams the filtered courses as one JSON array."""
+        Course.objects.create(
+            teacher=self.teacher,
+            title='Other Course',
+            code='OTH101',
+            description='Not matched by the search.',
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        response = self.client.get('/api/v1/courses/courses/export/?search=API')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = json.loads(b''.join(response.streaming_content))
+        course = Course.objects.default_related().get(pk=self.course.pk)
+        self.assertEqual(rows, [CourseListSerializer(course).data])
+
+    def test_course_list_cursor_pages(self):
+        """The course list pages newest first with opaque cursors."""
+        for i in range(25):
+            Course.objects.create(
+                teacher=self.teacher,
+                title=f'Paged Course {i}',
+                code=f'PAGE{i:03d}',
+                description='Paged.',
+            )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        first = self.client.get('/api/v1/courses/courses/').data
+        self.assertEqual(len(first['results']), 20)
+        self.assertIn('cursor=', first['next'])
+        second = self.client.get(first['next']).data
+        codes = [c['code'] for c in first['results'] + second['results']]
+        self.assertEqual(len(codes), 26)
+        self.assertEqual(codes[0], 'PAGE024')
+        self.assertEqual(codes[-1], 'API101')
+
     def test_teacher_can_update_own_course(self):
         """Course teacher can update their course."""
         self.client.credentials(
@@ -120,6 +223,22 @@ class CourseAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreater(len(response.data['results']), 0)
 
+    def test_course_list_matches_list_serializer(self):
+        """The value-row course list renders exactly like CourseListSerializer."""
+        self.teacher.first_name = 'Ada'
+        self.teacher.last_name = 'Lovelace'
+        self.teacher.save()
+        Enrollment.objects.create(student=self.student, course=self.course)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        response = self.client.get('/api/v1/courses/courses/')
+        course = Course.objects.default_related().get(pk=self.course.pk)
+        self.assertEqual(
+            response.data['results'],
+            [CourseListSerializer(course).data],
+        )
+
 
 class EnrollmentAPITest(APITestCase):
     """Tests for enrollment API endpoints."""
@@ -147,6 +266,50 @@ class EnrollmentAPITest(APITestCase):
         self.student_token = Token.objects.create(user=self.student)
         self.teacher_token = Token.objects.create(user=self.teacher)
 
+    def test_enrollment_list_matches_serializer(self):
+        """The value-row enrollment list renders exactly like EnrollmentSerializer."""
+        enrollment = Enrollment.objects.create(
+            student=self.student,
+            course=self.course,
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        response = self.client.get('/api/v1/courses/enrollments/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'],
+            [EnrollmentSerializer(enrollment).data],
+        )
+
+    def test_enrollment_list_pages_with_custom_ordering(self):
+        """A non-default ordering pages through every enrollment."""
+        for i in range(25):
+            student = User.objects.create_user(
+                username=f'paged_student_{i}',
+                email=f'paged{i}@test.com',
+                password='testpass123',
+                role='student',
+            )
+            Enrollment.objects.create(student=student, course=self.course)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.teacher_token.key}'
+        )
+        first = self.client.get('/api/v1/courses/enrollments/?ordering=status,id').data
+        self.assertEqual(len(first['results']), 20)
+        response = self.client.get(first['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = {row['id'] for row in first['results'] + response.data['results']}
+        self.assertEqual(len(ids), 25)
+
+        # Keys the value rows don't carry fall back to the default ordering
+        response = self.client.get(
+            '/api/v1/courses/enrollments/?ordering=student__username'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_student_can_enroll(self):
         """Students can enroll in a course via API."""
         self.client.credentials(
@@ -163,6 +326,34 @@ class EnrollmentAPITest(APITestCase):
             ).exists()
         )
 
+    def test_enroll_rejects_blocked_student_and_full_course(self):
+        """Blocked students and full courses are refused with a 400."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.student_token.key}'
+        )
+        url = f'/api/v1/courses/courses/{self.course.pk}/enroll/'
+        enrollment = Enrollment.objects.create(
+            student=self.student,
+            course=self.course,
+            status=Enrollment.Status.BLOCKED,
+        )
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('blocked', str(response.data))
+
+        enrollment.delete()
+        other = User.objects.create_user(
+            username='enroll_api_other',
+            email='enrollapiother@test.com',
+            password='testpass123',
+            role='student',
+        )
+        Enrollment.objects.create(student=other, course=self.course)
+        Course.objects.filter(pk=self.course.pk).update(max_students=1)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('capacity', str(response.data))
+
     def test_student_can_unenroll(self):
         """Students can unenroll from a course via API."""
         Enrollment.objects.create(
@@ -193,6 +384,42 @@ class EnrollmentAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_student_list_queries_do_not_grow_per_row(self):
+        """The students action joins each enrollment's student and reuses the course."""
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.teacher_token.key}'
+        )
+        url = f'/api/v1/courses/courses/{self.course.pk}/students/'
+        Enrollment.objects.create(student=self.student, course=self.course)
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+        for i in range(3):
+            student = User.objects.create_user(
+                username=f'api_extra_student_{i}',
+                email=f'apiextra{i}@test.com',
+                password='testpass123',
+                role='student',
+            )
+            Enrollment.objects.create(student=student, course=self.course)
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(response.data[0]['course_code'], self.course.code)
+
+    def test_student_actions_skip_listing_annotations(self):
+        """Course actions that don't show counts load the plain course row."""
+        Enrollment.objects.create(student=self.student, course=self.course)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.teacher_token.key}'
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                f'/api/v1/courses/courses/{self.course.pk}/'
+                f'students/{self.student.pk}/block/'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any('GROUP BY' in q['sql'] for q in ctx.captured_queries))
+
     def test_teacher_can_block_student(self):
         """Course teacher can block a student via API."""
         Enrollment.objects.create(
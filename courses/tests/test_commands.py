@@ -0,0 +1,87 @@
+"""
+Unit tests for the courses management commands.
+
+Runs seed_data end to end and checks that re-running it is harmless.
+"""
+
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.models import StatusUpdate, User
+from chat.models import Message
+from courses.models import Course, Enrollment, Feedback
+from notifications.models import Notification
+
+
+class SeedDataCommandTest(TestCase):
+    """Tests for the seed_data management command."""
+
+    def seed(self):
+        call_command('seed_data', stdout=StringIO())
+
+    def counts(self):
+        return {
+            model.__name__: model.objects.count()
+            for model in (User, Course, Enrollment, Feedback, StatusUpdate, Message, Notification)
+        }
+
+    def test_seed_creates_demo_data(self):
+        """Seeding an empty database should create the documented sample set."""
+        self.seed()
+        self.assertEqual(User.objects.filter(role='teacher', is_superuser=False).count(), 3)
+        self.assertEqual(User.objects.filter(role='student').count(), 5)
+        self.assertEqual(Course.objects.count(), 5)
+        self.assertEqual(Enrollment.objects.count(), 15)
+        self.assertEqual(Feedback.objects.count(), 8)
+        self.assertEqual(StatusUpdate.objects.count(), 6)
+        self.assertEqual(Message.objects.count(), 5)
+        self.assertEqual(Notification.objects.count(), 3)
+
+    def test_seed_is_idempotent(self):
+        """Running the command twice should not duplicate anything."""
+        self.seed()
+        first = self.counts()
+        self.seed()
+        self.assertEqual(self.counts(), first)
+
+    def test_seeded_users_can_log_in(self):
+        """Seeded accounts should use the documented passwords."""
+        self.seed()
+        self.assertTrue(User.objects.get(username='prof_smith').check_password('teacher123'))
+        self.assertTrue(User.objects.get(username='alice').check_password('student123'))
+        self.assertTrue(User.objects.get(username='admin').check_password('admin123'))
+
+    def test_seeded_users_have_profiles(self):
+        """Bulk-created seed users should get their profile details."""
+        self.seed()
+        self.assertEqual(
+            User.objects.get(username='prof_jones').profile.department, 'Mathematics',
+        )
+        self.assertEqual(User.objects.get(username='bob').profile.student_id, 'STU002')
+
+    def test_clear_removes_existing_data(self):
+        """--clear should drop non-seed rows before reseeding."""
+        self.seed()
+        Course.objects.create(
+            teacher=User.objects.get(username='prof_smith'),
+            title='Extra Course',
+            code='EXTRA1',
+            description='Not part of the seed set.',
+        )
+        call_command('seed_data', clear=True, stdout=StringIO())
+        self.assertFalse(Course.objects.filter(code='EXTRA1').exists())
+        self.assertEqual(Course.objects.count(), 5)
+
+    def test_reseeding_drops_cached_course_details(self):
+        """Rows re-inserted in bulk should clear the affected course's cached detail."""
+        self.seed()
+        course = Course.objects.get(code='CS101')
+        Enrollment.objects.filter(course=course, student__username='alice').delete()
+        key = Course.detail_cache_key(course.pk)
+        cache.set(key, ('"stale"', {}))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seed()
+        self.assertIsNone(cache.get(key))
@@ -8,9 +8,11 @@ validation, and unique constraint enforcement.
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 
-from courses.models import Course, Enrollment, Feedback
+from courses.models import Course, CourseMaterial, Enrollment, Feedback
 
 User = get_user_model()
 
@@ -60,6 +62,54 @@ class CourseModelTest(TestCase):
         )
         self.assertEqual(self.course.enrolled_count, 1)
 
+    def test_enrolled_count_annotation(self):
+        """with_enrolled_count() should count active enrollments only, without extra queries."""
+        for i, status in enumerate([Enrollment.Status.ACTIVE, Enrollment.Status.DROPPED]):
+            student = User.objects.create_user(
+                username=f'annotated_student_{i}',
+                email=f'annotated{i}@test.com',
+                password='testpass123',
+                role='student',
+            )
+            Enrollment.objects.create(student=student, course=self.course, status=status)
+        course = Course.objects.with_enrolled_count().get(pk=self.course.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(course.enrolled_count, 1)
+            self.assertFalse(course.is_full)
+
+    def test_get_absolute_url(self):
+        """A course links to its detail page."""
+        self.assertEqual(self.course.get_absolute_url(), f'/courses/{self.course.pk}/')
+
+    def test_default_related(self):
+        """default_related() should load the teacher and counts in one query."""
+        with self.assertNumQueries(1):
+            course = Course.objects.default_related().get(pk=self.course.pk)
+            self.assertEqual(course.teacher.username, self.teacher.username)
+            self.assertEqual(course.enrolled_count, 0)
+            self.assertFalse(course.is_full)
+
+    def test_detail_stats_fallback(self):
+        """Without annotations, materials_count and average_rating query once each."""
+        for i, rating in enumerate([5, 4, 4]):
+            student = User.objects.create_user(
+                username=f'rating_student_{i}',
+                email=f'rating{i}@test.com',
+                password='testpass123',
+                role='student',
+            )
+            Feedback.objects.create(
+                student=student, course=self.course, rating=rating, comment='Ok.',
+            )
+        course = Course.objects.get(pk=self.course.pk)
+        with self.assertNumQueries(2):
+            self.assertEqual(course.materials_count, 0)
+            self.assertEqual(course.average_rating, 4.3)
+        annotated = Course.objects.with_detail_stats().get(pk=self.course.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.materials_count, 0)
+            self.assertEqual(annotated.average_rating, 4.3)
+
     def test_is_full_property(self):
         """is_full should return True when enrollment reaches max_students."""
         for i in range(2):
@@ -75,6 +125,12 @@ class CourseModelTest(TestCase):
                 status=Enrollment.Status.ACTIVE,
             )
         self.assertTrue(self.course.is_full)
+        course = Course.objects.with_enrolled_count().get(pk=self.course.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(course.is_full)
+        self.assertTrue(
+            Course.objects.with_enrolled_count().filter(at_capacity=True).exists()
+        )
 
     def test_unique_course_code(self):
         """Course codes must be unique."""
@@ -136,6 +192,56 @@ class EnrollmentModelTest(TestCase):
         self.assertIn('active', result)
 
 
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class CourseMaterialModelTest(TestCase):
+    """Tests for the CourseMaterial model."""
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username='material_teacher',
+            email='materialteacher@test.com',
+            password='testpass123',
+            role='teacher',
+        )
+        self.course = Course.objects.create(
+            teacher=self.teacher,
+            title='Material Course',
+            code='MAT101',
+            description='Testing materials.',
+        )
+        self.material = CourseMaterial.objects.create(
+            course=self.course,
+            uploaded_by=self.teacher,
+            title='Notes',
+            file=SimpleUploadedFile('notes.pdf', b'x' * 1234),
+        )
+
+    def test_file_size_recorded_on_upload(self):
+        """Saving a new file should record its size."""
+        self.assertEqual(self.material.file_size, 1234)
+        self.assertEqual(self.material.file_size_display, '1.2 KB')
+
+    def test_unchanged_file_not_resized(self):
+        """Re-saving without a new file should not read the file size again."""
+        material = CourseMaterial.objects.get(pk=self.material.pk)
+        # Any size lookup would now fail with FileNotFoundError
+        default_storage.delete(material.file.name)
+        material.title = 'Renamed notes'
+        material.save()
+        self.assertEqual(material.file_size, 1234)
+
+    def test_replaced_file_resized(self):
+        """Replacing the file should record the new size."""
+        material = CourseMaterial.objects.get(pk=self.material.pk)
+        material.file = SimpleUploadedFile('notes-v2.pdf', b'x' * 99)
+        material.save()
+        self.assertEqual(material.file_size, 99)
+        self.assertEqual(material.file_size_display, '99 B')
+
+
 class FeedbackModelTest(TestCase):
     """Tests for the Feedback model."""
 
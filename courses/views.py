@@ -28,7 +28,7 @@ class CourseListView(LoginRequiredMixin, View):
     def get(self, request):
         """List all active courses with optional search filtering."""
         query = request.GET.get('q', '').strip()
-        courses = Course.objects.filter(is_active=True).select_related('teacher')
+        courses = Course.objects.filter(is_active=True)
 
         if query:
             courses = courses.filter(
@@ -39,6 +39,11 @@ class CourseListView(LoginRequiredMixin, View):
                 category__icontains=query
             )
 
+        # Join teachers and count enrollments in the same query; the
+        # template shows both. Meta ordering is ignored on aggregated
+        # querysets, so restate it.
+        courses = courses.default_related().order_by('-created_at')
+
         # Track which courses the current student is enrolled in
         enrolled_course_ids = []
         if request.user.is_student:
@@ -68,7 +73,7 @@ class CourseDetailView(LoginRequiredMixin, View):
     def get(self, request, pk):
         """Display the course detail page."""
         course = get_object_or_404(
-            Course.objects.select_related('teacher'), pk=pk,
+            Course.objects.default_related(), pk=pk,
         )
         materials = course.materials.all()
         feedbacks = course.feedbacks.select_related('student').all()
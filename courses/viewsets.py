@@ -6,22 +6,43 @@ course material upload, and feedback submission. Applies custom
 permission classes to enforce teacher/student role restrictions.
 """
 
+import hashlib
+
+import orjson
+from django.core.cache import cache
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 
+from elearning.pagination import (
+    CreatedAtCursorPagination,
+    EnrolledAtCursorPagination,
+)
 from elearning.permissions import (
     IsCourseTeacher,
     IsEnrolledOrTeacher,
     IsStudent,
     IsTeacher,
 )
-
-from .models import Course, CourseMaterial, Enrollment, Feedback
+from elearning.renderers import ORJSONRenderer, stream_json_array
+
+from .models import (
+    COURSE_DETAIL_CACHE_TIMEOUT,
+    Course,
+    CourseMaterial,
+    Enrollment,
+    Feedback,
+)
 from .serializers import (
+    ENROLLMENT_ONLY_FIELDS,
+    FEEDBACK_ONLY_FIELDS,
     CourseCreateSerializer,
     CourseDetailSerializer,
     CourseListSerializer,
@@ -29,6 +50,11 @@ from .serializers import (
     EnrollmentCreateSerializer,
     EnrollmentSerializer,
     FeedbackSerializer,
+    course_values,
+    enrollment_values,
+    format_course_row,
+    format_course_rows,
+    format_enrollment_rows,
 )
 
 
@@ -49,6 +75,11 @@ class CourseViewSet(viewsets.ModelViewSet):
     delete:   DELETE /api/v1/courses/{id}/
     """
 
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = CreatedAtCursorPagination
+    # Numeric ids only, so '/01/' cannot cache a second copy of course 1
+    # that the signals would never invalidate
+    lookup_value_regex = r'\d+'
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -57,11 +88,55 @@ class CourseViewSet(viewsets.ModelViewSet):
     filterset_fields = ['category', 'is_active', 'teacher']
     search_fields = ['title', 'code', 'category', 'description']
     ordering_fields = ['title', 'code', 'created_at']
-    ordering = ['-created_at']
+    ordering = ['-created_at', '-id']
 
     def get_queryset(self):
-        """Return courses with select_related for performance."""
-        return Course.objects.select_related('teacher').all()
+        """
+        Return courses with the teacher joined and enrollments counted
+        for the actions that show them; the detail view also gets its
+        material and rating aggregates. The write and enrollment actions
+        only need the course row itself.
+        """
+        if self.action not in ('list', 'retrieve', 'export'):
+            return Course.objects.all()
+        queryset = Course.objects.default_related()
+        if self.action == 'retrieve':
+            queryset = queryset.with_detail_stats()
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        List courses from plain value rows, shaped like CourseListSerializer
+        but without building model instances or serializer fields per row.
+        """
+        courses = course_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(courses)
+        if page is not None:
+            return self.get_paginated_response(format_course_rows(page))
+        return Response(format_course_rows(courses))
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return the course detail, cached with an ETag of its content.
+
+        The payload is the same for every user and is cached until the
+        courses signals drop it. A client that sends the current ETag in
+        If-None-Match gets an empty 304 instead.
+        """
+        key = Course.detail_cache_key(int(kwargs['pk']))
+        cached = cache.get(key)
+        if cached is None:
+            data = dict(self.get_serializer(self.get_object()).data)
+            etag = quote_etag(hashlib.md5(orjson.dumps(data)).hexdigest())
+            cached = (etag, data)
+            cache.set(key, cached, COURSE_DETAIL_CACHE_TIMEOUT)
+        etag, data = cached
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response['ETag'] = etag
+        return response
 
     def get_serializer_class(self):
         """Use different serializers for list vs detail vs create."""
@@ -92,6 +167,21 @@ class CourseViewSet(viewsets.ModelViewSet):
     # Custom actions nested under a course
     # ------------------------------------------------------------------
 
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Stream every course matching the list filters as one JSON array,
+        unpaginated, in the list endpoint's row format.
+
+        GET /api/v1/courses/courses/export/
+        """
+        courses = course_values(self.filter_queryset(self.get_queryset()))
+        rows = map(format_course_row, courses.iterator(chunk_size=500))
+        return StreamingHttpResponse(
+            stream_json_array(rows),
+            content_type='application/json',
+        )
+
     @action(
         detail=True,
         methods=['get'],
@@ -105,9 +195,11 @@ class CourseViewSet(viewsets.ModelViewSet):
         GET /api/v1/courses/{id}/students/
         """
         course = self.get_object()
-        enrollments = Enrollment.objects.filter(
-            course=course,
-        ).select_related('student')
+        # Through the reverse manager each enrollment gets this course
+        # instance attached, so course_code/course_title cost no queries.
+        enrollments = course.enrollments.select_related('student').only(
+            *ENROLLMENT_ONLY_FIELDS,
+        )
         serializer = EnrollmentSerializer(enrollments, many=True)
         return Response(serializer.data)
 
@@ -128,19 +220,22 @@ class CourseViewSet(viewsets.ModelViewSet):
             data={'course_id': course.pk},
             context={'request': request},
         )
-        serializer.is_valid(raise_exception=True)
+        # Validation locks the course row, so the capacity check and the
+        # insert below happen in one transaction
+        with transaction.atomic():
+            serializer.is_valid(raise_exception=True)
 
-        # Check for an existing enrollment to re-activate
-        enrollment, created = Enrollment.objects.get_or_create(
-            student=request.user,
-            course=course,
-            defaults={'status': Enrollment.Status.ACTIVE},
-        )
+            # Check for an existing enrollment to re-activate
+            enrollment, created = Enrollment.objects.get_or_create(
+                student=request.user,
+                course=course,
+                defaults={'status': Enrollment.Status.ACTIVE},
+            )
 
-        if not created and enrollment.status == Enrollment.Status.DROPPED:
-            enrollment.status = Enrollment.Status.ACTIVE
-            enrollment.dropped_at = None
-            enrollment.save()
+            if not created and enrollment.status == Enrollment.Status.DROPPED:
+                enrollment.status = Enrollment.Status.ACTIVE
+                enrollment.dropped_at = None
+                enrollment.save()
 
         return Response(
             EnrollmentSerializer(enrollment).data,
@@ -194,10 +289,9 @@ class CourseViewSet(viewsets.ModelViewSet):
         """
         course = self.get_object()
         try:
-            enrollment = Enrollment.objects.get(
-                student_id=student_id,
-                course=course,
-            )
+            enrollment = course.enrollments.select_related('student').only(
+                *ENROLLMENT_ONLY_FIELDS,
+            ).get(student_id=student_id)
         except Enrollment.DoesNotExist:
             return Response(
                 {'detail': 'Enrollment not found.'},
@@ -222,10 +316,9 @@ class CourseViewSet(viewsets.ModelViewSet):
         """
         course = self.get_object()
         try:
-            enrollment = Enrollment.objects.get(
-                student_id=student_id,
-                course=course,
-            )
+            enrollment = course.enrollments.select_related('student').only(
+                *ENROLLMENT_ONLY_FIELDS,
+            ).get(student_id=student_id)
         except Enrollment.DoesNotExist:
             return Response(
                 {'detail': 'Enrollment not found.'},
@@ -251,9 +344,25 @@ class EnrollmentViewSet(viewsets.ReadOnlyModelViewSet):
 
     serializer_class = EnrollmentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = EnrolledAtCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['status', 'course']
-    ordering = ['-enrolled_at']
+    # Cursor pagination reads the position from the enrollment_values()
+    # rows, so only keys those rows carry can be ordered on
+    ordering_fields = ['enrolled_at', 'status', 'course', 'id']
+    ordering = ['-enrolled_at', '-id']
+
+    def list(self, request, *args, **kwargs):
+        """
+        List enrollments from plain value rows, shaped like
+        EnrollmentSerializer.
+        """
+        enrollments = enrollment_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(enrollments)
+        if page is not None:
+            return self.get_paginated_response(format_enrollment_rows(page))
+        return Response(format_enrollment_rows(enrollments))
 
     def get_queryset(self):
         """
@@ -264,12 +373,12 @@ class EnrollmentViewSet(viewsets.ReadOnlyModelViewSet):
         """
         user = self.request.user
         if user.is_teacher:
-            return Enrollment.objects.filter(
-                course__teacher=user,
-            ).select_related('student', 'course')
-        return Enrollment.objects.filter(
-            student=user,
-        ).select_related('student', 'course')
+            enrollments = Enrollment.objects.filter(course__teacher=user)
+        else:
+            enrollments = Enrollment.objects.filter(student=user)
+        return enrollments.select_related('student', 'course').only(
+            *ENROLLMENT_ONLY_FIELDS,
+        )
 
 
 class CourseMaterialViewSet(viewsets.ModelViewSet):
@@ -289,16 +398,18 @@ class CourseMaterialViewSet(viewsets.ModelViewSet):
 
     serializer_class = CourseMaterialSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     parser_classes = [MultiPartParser, FormParser]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['course', 'material_type']
     ordering = ['-uploaded_at']
 
     def get_queryset(self):
-        """Return materials, optionally filtered by course."""
-        return CourseMaterial.objects.select_related(
-            'course', 'uploaded_by',
-        ).all()
+        """
+        Return materials, optionally filtered by course. The serializer
+        only needs course_id, so just the uploader is joined.
+        """
+        return CourseMaterial.objects.select_related('uploaded_by')
 
     def get_permissions(self):
         """Teachers can create/update/delete; all authenticated can read."""
@@ -330,15 +441,16 @@ class FeedbackViewSet(
 
     serializer_class = FeedbackSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['course', 'student', 'rating']
     ordering = ['-created_at']
 
     def get_queryset(self):
-        """Return all feedback with related objects."""
+        """Return all feedback with the serialized related columns."""
         return Feedback.objects.select_related(
             'course', 'student',
-        ).all()
+        ).only(*FEEDBACK_ONLY_FIELDS)
 
     def get_permissions(self):
         """Only students can create feedback."""
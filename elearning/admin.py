@@ -0,0 +1,28 @@
+"""
+Shared Django admin helpers for the eLearning platform.
+
+Mixins here are combined with ModelAdmin classes across the apps so that
+common changelist behaviour lives in one place.
+"""
+
+
+class ContentPreviewAdminMixin:
+    """
+    Show a truncated ``content`` column in the changelist.
+
+    Subclasses list ``content_preview`` in ``list_display`` and may set
+    ``preview_length``. The full column is loaded on purpose: each row's
+    ``__str__`` (used by the action checkbox) reads ``content`` too, so
+    deferring it would cost one extra query per row.
+    """
+
+    # Characters shown in the changelist before the text is cut off
+    preview_length = 60
+
+    def content_preview(self, obj):
+        """Return truncated content for the list display."""
+        content = obj.content
+        if len(content) > self.preview_length:
+            return content[:self.preview_length] + '...'
+        return content
+    content_preview.short_description = 'Content'
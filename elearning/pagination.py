@@ -0,0 +1,40 @@
+"""
+Custom DRF pagination classes for the eLearning platform.
+
+The project default is page-number pagination (see REST_FRAMEWORK in
+settings). Feeds that are read newest-first and can grow without bound
+use cursor pagination instead, so each page is an index range seek
+rather than an OFFSET scan over every earlier row.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Cursor pagination over a ``(created_at, id)`` key, newest first.
+
+    Used for status update feeds and the course catalogue; relies on an
+    index covering ``created_at`` for constant-time page fetches. The id
+    tie-breaker gives rows sharing a timestamp (bulk inserts) a fixed
+    order, so a cursor stays valid across rows with equal timestamps.
+    Views that also use OrderingFilter must set the same default
+    ``ordering``, since the filter's ordering takes precedence.
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = 20
+
+
+class EnrolledAtCursorPagination(CursorPagination):
+    """
+    Cursor pagination over an enrollment's ``(enrolled_at, id)``, newest
+    first.
+
+    Used for enrollment lists, which grow with every enrolment and are
+    read from the most recent. The id tie-breaker plays the same role as
+    in CreatedAtCursorPagination.
+    """
+
+    ordering = ('-enrolled_at', '-id')
+    page_size = 20
@@ -53,8 +53,9 @@ class IsCourseTeacher(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        # obj is expected to be a Course instance
-        return obj.teacher == request.user
+        # obj is expected to be a Course instance; comparing ids avoids
+        # loading the teacher row
+        return obj.teacher_id == request.user.pk
 
 
 class IsEnrolledOrTeacher(BasePermission):
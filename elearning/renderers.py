@@ -0,0 +1,55 @@
+"""
+Custom DRF renderers for the eLearning platform.
+
+Provides an orjson-backed JSON renderer for high-volume list endpoints,
+where JSON encoding is a significant share of response time, and a
+generator for streaming large JSON exports.
+"""
+
+from itertools import islice
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render responses as JSON using orjson.
+
+    A drop-in replacement for DRF's JSONRenderer. Types orjson cannot
+    encode itself (lazy translation strings, Decimals, querysets, ...)
+    fall back to DRF's own JSONEncoder so output matches the default
+    renderer.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    _fallback = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._fallback)
+
+
+def stream_json_array(rows, chunk_size=500):
+    """
+    Yield an iterable of JSON-serializable rows as one JSON array.
+
+    Rows are encoded chunk_size at a time, so a StreamingHttpResponse
+    fed from a queryset .iterator() holds one chunk in memory rather
+    than the whole export.
+    """
+    rows = iter(rows)
+    yield b'['
+    separator = b''
+    while chunk := list(islice(rows, chunk_size)):
+        yield separator + b','.join(
+            orjson.dumps(row, default=ORJSONRenderer._fallback) for row in chunk
+        )
+        separator = b','
+    yield b']'
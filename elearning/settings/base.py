@@ -38,6 +38,9 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    # Lets index expressions take an operator class (user search trigram
+    # indexes); its PostgreSQL hooks do nothing on other backends
+    'django.contrib.postgres',
 
     # Third-party apps
     'rest_framework',
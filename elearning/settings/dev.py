@@ -7,8 +7,11 @@ Extends base settings with local development configuration:
 - Celery tasks run synchronously (no Celery worker needed)
 - In-memory channel layer for real-time WebSocket chat (no Redis needed)
 - Console email backend for testing
+- Fast (insecure) password hashing when running the test suite
 """
 
+import sys
+
 from .base import *  # noqa: F401, F403
 
 # ---------------------------------------------------------------------------
@@ -64,3 +67,13 @@ CHANNEL_LAYERS = {
 # Email - Print to console during development
 # ---------------------------------------------------------------------------
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+# ---------------------------------------------------------------------------
+# Tests - Use a fast password hasher when running `manage.py test`
+# The default PBKDF2 hasher makes every create_user() call take tens of
+# milliseconds. MD5 is insecure and must never be used outside tests.
+# The suite is also safe to run across processes on multi-core machines:
+#   python manage.py test --parallel auto
+# ---------------------------------------------------------------------------
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
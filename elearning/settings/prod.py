@@ -30,11 +30,16 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Keep connections open between requests and chat messages instead
+        # of reconnecting to PostgreSQL for every one; stale connections are
+        # checked before reuse.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 # ---------------------------------------------------------------------------
-# Redis - Channel layer for WebSocket chat + Celery task broker
+# Redis - Channel layer for WebSocket chat, Celery task broker and cache
 # ---------------------------------------------------------------------------
 REDIS_HOST = os.environ.get('REDIS_HOST', '127.0.0.1')
 
@@ -50,6 +55,15 @@ CHANNEL_LAYERS = {
 CELERY_BROKER_URL = f'redis://{REDIS_HOST}:6379/1'
 CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:6379/2'
 
+# Shared cache so cached data (e.g. profile status lists) is consistent
+# across Gunicorn and Daphne worker processes
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f'redis://{REDIS_HOST}:6379/3',
+    },
+}
+
 # ---------------------------------------------------------------------------
 # Static files - collected to staticfiles/ and served by Nginx
 # ---------------------------------------------------------------------------
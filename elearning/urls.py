@@ -41,7 +41,11 @@ def home(request):
     if request.user.is_authenticated:
         context = {}
         if request.user.is_teacher:
-            context['taught_courses'] = request.user.taught_courses.all()[:5]
+            context['taught_courses'] = (
+                request.user.taught_courses
+                .with_enrolled_count()
+                .order_by('-created_at')[:5]
+            )
         else:
             active_enrollments = request.user.enrollments.filter(
                 status='active',
@@ -8,6 +8,9 @@ notification generation.
 
 from celery import shared_task
 
+# Rows fetched and inserted per round-trip when fanning out notifications
+BATCH_SIZE = 500
+
 
 @shared_task
 def create_notification(recipient_id, notification_type, title, message, link=''):
@@ -33,27 +36,32 @@ def notify_course_students(course_id, notification_type, title, message, link=''
     """
     Create notifications for all actively enrolled students in a course.
 
-    Called when a teacher uploads new course material. Uses bulk_create
-    for efficiency when notifying many students at once.
+    Called when a teacher uploads new course material. Streams the
+    enrolled student IDs and inserts notifications with bulk_create in
+    batches of BATCH_SIZE, so large courses never sit fully in memory.
     """
     from courses.models import Enrollment
     from .models import Notification
 
-    # Get all active student IDs for this course
+    # Stream active student IDs rather than loading the whole roster
     student_ids = Enrollment.objects.filter(
         course_id=course_id,
         status=Enrollment.Status.ACTIVE,
-    ).values_list('student_id', flat=True)
+    ).values_list('student_id', flat=True).iterator(chunk_size=BATCH_SIZE)
 
-    # Bulk create notifications for all enrolled students
-    notifications = [
-        Notification(
+    # Bulk create notifications one batch at a time so memory stays bounded
+    # by the batch size rather than the course size
+    batch = []
+    for student_id in student_ids:
+        batch.append(Notification(
             recipient_id=student_id,
             notification_type=notification_type,
             title=title,
             message=message,
             link=link,
-        )
-        for student_id in student_ids
-    ]
-    Notification.objects.bulk_create(notifications)
+        ))
+        if len(batch) >= BATCH_SIZE:
+            Notification.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Notification.objects.bulk_create(batch)